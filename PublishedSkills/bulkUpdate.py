@@ -0,0 +1,143 @@
+#  Copyright (c) 2026
+#
+#  This file, bulkUpdate.py, is part of Project Alice.
+#
+#  Project Alice is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>
+#
+#  Last modified: 2026.10.18 at 10:00:00 CEST
+
+from __future__ import annotations
+
+import json
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import List, Tuple
+
+import click
+from git import GitError, Repo
+
+sys.path.append(str(Path(__file__).resolve().parent.parent / 'Tools' / 'Common'))
+from GitErrors import errorMessage
+
+
+skillRoot = Path(__file__).resolve().parent
+
+
+@dataclass
+class SyncResult:
+	"""
+	Status is `updated`, `unchanged`, `ahead` when only the local branch has new commits, or `failed`, with the reason why
+	"""
+	skill: str
+	status: str
+	before: str = ''
+	after: str = ''
+	reason: str = ''
+
+
+def remoteHead(repo: Repo, remote: str, branch: str) -> str:
+	"""
+	Asks the remote for the commit its branch points to, without fetching anything
+	"""
+	for line in str(repo.git.ls_remote(remote, f'refs/heads/{branch}')).splitlines():
+		sha, ref = line.split('\t')
+		if ref == f'refs/heads/{branch}':
+			return sha
+	return ''
+
+
+def syncSkill(skill: Path, remote: str, branch: str) -> SyncResult:
+	"""
+	Fast forwards the skill to the remote branch. Skills already at the remote head are not fetched,
+	skills ahead of it, that diverged from it or that are checked out on another branch are left alone
+	"""
+	result = SyncResult(skill.name, 'failed')
+	try:
+		repo = Repo(skill)
+		result.before = result.after = repo.head.commit.hexsha
+
+		target = remoteHead(repo, remote, branch)
+		if not target:
+			result.reason = f'No branch {branch} on {remote}'
+			return result
+
+		if target == result.before:
+			result.status = 'unchanged'
+			return result
+
+		if not repo.head.is_detached and repo.active_branch.name != branch:
+			result.reason = f'Checked out on branch {repo.active_branch.name}, not {branch}'
+			return result
+
+		repo.git.fetch(remote, f'refs/heads/{branch}')
+		before, after = repo.head.commit, repo.commit(target)
+		if repo.is_ancestor(after, before):
+			result.status = 'ahead'
+			result.reason = f'Has commits not on {remote}/{branch}'
+			return result
+
+		if not repo.is_ancestor(before, after):
+			result.reason = f'Diverged from {remote}/{branch}'
+			return result
+
+		if repo.head.is_detached:
+			repo.git.checkout(target, detach=True, quiet=True)
+		else:
+			repo.git.merge(target, ff_only=True, quiet=True)
+
+		result.after = repo.head.commit.hexsha
+		result.status = 'updated'
+	except (GitError, ValueError) as e:
+		result.reason = errorMessage(e)
+
+	return result
+
+
+def skillRepos(skills: Tuple[str, ...]) -> List[Path]:
+	return [gitDir.parent for gitDir in sorted(skillRoot.glob('*/.git')) if not skills or gitDir.parent.name in skills]
+
+
+@click.command()
+@click.argument('skills', nargs=-1)
+@click.option('-r', '--remote', default='origin', show_default=True, help='Remote to sync from')
+@click.option('-b', '--branch', default='master', show_default=True, help='Remote branch to fast forward to')
+@click.option('-j', '--jobs', default=8, type=click.IntRange(min=1), show_default=True, help='Number of skills synced concurrently')
+@click.option('--json', 'asJson', is_flag=True, help='Print the results as json')
+def main(skills: Tuple[str, ...], remote: str, branch: str, jobs: int, asJson: bool):
+	"""
+	Fetches and fast forwards every skill, or only SKILLS if given, to the remote branch.
+	Exits with 1 if any skill failed to sync
+	"""
+	repos = skillRepos(skills)
+	with ThreadPoolExecutor(max_workers=jobs) as executor:
+		results = list(executor.map(lambda skill: syncSkill(skill, remote, branch), repos))
+
+	if asJson:
+		click.echo(json.dumps([asdict(result) for result in results], indent='\t'))
+	else:
+		for result in results:
+			change = f'{result.before[:8]}..{result.after[:8]}' if result.status == 'updated' else ''
+			click.echo(f'{result.skill:<30} {result.status:<9} {change or result.reason}')
+
+		counts = {status: sum(result.status == status for result in results) for status in ('updated', 'unchanged', 'ahead', 'failed')}
+		click.echo(', '.join(f'{count} {status}' for status, count in counts.items()))
+
+	if any(result.status == 'failed' for result in results):
+		sys.exit(1)
+
+
+if __name__ == '__main__':
+	main()
@@ -0,0 +1,124 @@
+#  Copyright (c) 2026
+#
+#  This file, FileCache.py, is part of Project Alice.
+#
+#  Project Alice is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>
+#
+#  Last modified: 2026.10.18 at 10:00:00 CEST
+
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict
+
+
+cacheDir = Path(__file__).resolve().parent.parent / '.cache'
+
+
+class FileCache:
+	"""
+	Persistent cache of what was parsed out of files, shared by the tools. Entries are keyed by
+	the file path and are valid as long as the file's mtime and size did not change. If they did,
+	the content hash decides whether the file really has to be parsed again.
+	Every namespace is stored in its own file, values have to be json serializable
+	"""
+
+	def __init__(self, namespace: str, enabled: bool = True):
+		self._file = cacheDir / f'{namespace}.json'
+		self._enabled = enabled
+		self._lock = threading.Lock()
+		self._entries: Dict[str, dict] = dict()
+		self._dirty = False
+		self.hits = 0
+		self.misses = 0
+
+		if not enabled:
+			return
+
+		try:
+			self._entries = json.loads(self._file.read_text(encoding='utf-8'))
+		except (OSError, ValueError):
+			pass
+
+
+	def __enter__(self) -> FileCache:
+		return self
+
+
+	def __exit__(self, *args):
+		self.save()
+
+
+	def get(self, file: Path, parser: Callable[[bytes], Any]) -> Any:
+		"""
+		Returns what parser returns for the content of that file, out of the cache if the file did not change.
+		Safe to call from several threads
+		"""
+		if not self._enabled:
+			return parser(file.read_bytes())
+
+		key = str(file.resolve())
+		stat = file.stat()
+
+		with self._lock:
+			entry = self._entries.get(key)
+
+		if entry and entry['mtime'] == stat.st_mtime_ns and entry['size'] == stat.st_size:
+			self.hits += 1
+			return entry['value']
+
+		content = file.read_bytes()
+		contentHash = hashlib.sha1(content).hexdigest()
+		if entry and entry['hash'] == contentHash:
+			self.hits += 1
+			value = entry['value']
+		else:
+			self.misses += 1
+			value = parser(content)
+
+		with self._lock:
+			self._entries[key] = {
+				'mtime': stat.st_mtime_ns,
+				'size' : stat.st_size,
+				'hash' : contentHash,
+				'value': value
+			}
+			self._dirty = True
+
+		return value
+
+
+	def save(self):
+		"""
+		Writes the cache to disk, forgetting about files that do not exist anymore
+		"""
+		if not self._enabled:
+			return
+
+		with self._lock:
+			stale = [key for key in self._entries if not Path(key).exists()]
+			for key in stale:
+				del self._entries[key]
+
+			if not self._dirty and not stale:
+				return
+
+			self._file.parent.mkdir(parents=True, exist_ok=True)
+			tmpFile = self._file.with_suffix('.tmp')
+			tmpFile.write_text(json.dumps(self._entries, ensure_ascii=False), encoding='utf-8')
+			tmpFile.replace(self._file)
+			self._dirty = False
@@ -0,0 +1,36 @@
+#  Copyright (c) 2026
+#
+#  This file, GitErrors.py, is part of Project Alice.
+#
+#  Project Alice is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>
+#
+#  Last modified: 2026.10.18 at 10:00:00 CEST
+
+from __future__ import annotations
+
+from git import GitCommandError
+
+
+def errorMessage(error: Exception) -> str:
+	"""
+	The first fatal or error line git printed, if any, to keep the status report on one line
+	"""
+	message = error.stderr if isinstance(error, GitCommandError) and error.stderr else str(error)
+	lines = [line.strip(" \t'") for line in message.splitlines() if line.strip(" \t'")]
+	for line in lines:
+		for prefix in ('fatal:', 'error:'):
+			if prefix in line:
+				return line[line.index(prefix):]
+
+	return lines[0] if lines else type(error).__name__
@@ -0,0 +1,224 @@
+#  Copyright (c) 2026
+#
+#  This file, SkillCatalogue.py, is part of Project Alice.
+#
+#  Project Alice is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>
+#
+#  Last modified: 2026.10.18 at 10:00:00 CEST
+
+from __future__ import annotations
+
+import json
+import os
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+from FileCache import cacheDir
+
+
+EXCLUDED_DIRECTORIES = {'.git', '.github', '.idea', '.vscode', '__pycache__', '.mypy_cache', '.pytest_cache', '.venv', 'venv', 'node_modules'}
+
+
+@dataclass
+class Skill:
+	"""
+	What a skill directory holds. Paths are posix and relative to the skill directory,
+	`directory` is relative to the catalogue root. `stamps` are the mtimes of every directory
+	of the skill and of its install file, the skill is scanned again as soon as one of them changes
+	"""
+	name: str
+	directory: str
+	installFile: str
+	install: Optional[dict] = None
+	talks: Dict[str, str] = field(default_factory=dict)
+	dialogTemplates: Dict[str, str] = field(default_factory=dict)
+	samples: List[str] = field(default_factory=list)
+	sources: List[str] = field(default_factory=list)
+	stamps: Dict[str, int] = field(default_factory=dict)
+
+
+	@property
+	def languages(self) -> List[str]:
+		return sorted(set(self.talks) | set(self.dialogTemplates))
+
+
+class SkillCatalogue:
+	"""
+	Index of the published skills, shared by the tools so that the skill tree is walked only once.
+	A skill is a directory holding an install file, right under the root or one level deeper.
+	The index is kept on disk and refreshed on load: only the skills with a directory or install file
+	whose mtime changed are scanned again
+	"""
+
+	VERSION = 1
+	CACHE_FILE = cacheDir / 'catalogue.json'
+
+
+	def __init__(self, root: Path, cacheFile: Optional[Path] = CACHE_FILE):
+		self._root = root
+		self._cacheFile = cacheFile
+		self._skills: Dict[str, Skill] = dict()
+		self.rescanned: List[str] = list()
+
+		if cacheFile:
+			try:
+				content = json.loads(cacheFile.read_text(encoding='utf-8'))
+				if content.get('version') == self.VERSION:
+					entries = content['roots'].get(str(root.resolve()), dict())
+					self._skills = {directory: Skill(**entry) for directory, entry in entries.items()}
+			except (OSError, ValueError, KeyError, TypeError):
+				self._skills = dict()
+
+		self.refresh()
+
+
+	def __enter__(self) -> SkillCatalogue:
+		return self
+
+
+	def __exit__(self, *args):
+		self.save()
+
+
+	def __iter__(self) -> Iterator[Skill]:
+		return iter(sorted(self._skills.values(), key=lambda skill: skill.directory))
+
+
+	def __len__(self) -> int:
+		return len(self._skills)
+
+
+	def get(self, name: str) -> Optional[Skill]:
+		return next((skill for skill in self._skills.values() if skill.name == name), None)
+
+
+	def path(self, skill: Skill, relative: str = '') -> Path:
+		return self._root / skill.directory / relative if relative else self._root / skill.directory
+
+
+	def installFiles(self) -> List[Path]:
+		return [self.path(skill, skill.installFile) for skill in self]
+
+
+	def talkFiles(self) -> List[Path]:
+		return [self.path(skill, talk) for skill in self for _, talk in sorted(skill.talks.items())]
+
+
+	def dialogTemplates(self) -> List[Path]:
+		return [self.path(skill, template) for skill in self for _, template in sorted(skill.dialogTemplates.items())]
+
+
+	def sampleFiles(self) -> List[Path]:
+		return [self.path(skill, sample) for skill in self for sample in skill.samples]
+
+
+	def sourceFiles(self) -> List[Path]:
+		return [self.path(skill, source) for skill in self for source in skill.sources]
+
+
+	def refresh(self) -> List[str]:
+		"""
+		Lists the skill directories and scans those that are new or changed. Returns the rescanned ones
+		"""
+		skills = dict()
+		self.rescanned = list()
+		for directory in self._skillDirectories():
+			relative = directory.relative_to(self._root).as_posix()
+			skill = self._skills.get(relative)
+			if not skill or not self._isFresh(skill):
+				skill = self._scan(directory, relative)
+				self.rescanned.append(relative)
+
+			skills[relative] = skill
+
+		self._skills = skills
+		return self.rescanned
+
+
+	def save(self):
+		if not self._cacheFile:
+			return
+
+		try:
+			content = json.loads(self._cacheFile.read_text(encoding='utf-8'))
+			if content.get('version') != self.VERSION:
+				raise ValueError
+		except (OSError, ValueError):
+			content = {'version': self.VERSION, 'roots': dict()}
+
+		content['roots'][str(self._root.resolve())] = {directory: asdict(skill) for directory, skill in self._skills.items()}
+		self._cacheFile.parent.mkdir(parents=True, exist_ok=True)
+		tmpFile = self._cacheFile.with_suffix('.tmp')
+		tmpFile.write_text(json.dumps(content, ensure_ascii=False), encoding='utf-8')
+		tmpFile.replace(self._cacheFile)
+
+
+	def _skillDirectories(self) -> List[Path]:
+		if not self._root.is_dir():
+			return list()
+
+		directories = list()
+		for directory in sorted(self._root.iterdir()):
+			if not directory.is_dir() or directory.name in EXCLUDED_DIRECTORIES:
+				continue
+
+			if any(directory.glob('*.install')):
+				directories.append(directory)
+			else:
+				directories.extend(sorted(subDirectory.parent for subDirectory in directory.glob('*/*.install')))
+
+		return list(dict.fromkeys(directories))
+
+
+	def _isFresh(self, skill: Skill) -> bool:
+		for relative, mtime in skill.stamps.items():
+			try:
+				if self.path(skill, relative).stat().st_mtime_ns != mtime:
+					return False
+			except OSError:
+				return False
+
+		return True
+
+
+	def _scan(self, directory: Path, relative: str) -> Skill:
+		installFile = min(directory.glob('*.install'))
+		skill = Skill(name=installFile.stem, directory=relative, installFile=installFile.name)
+		try:
+			skill.install = json.loads(installFile.read_text(encoding='utf-8'))
+		except (OSError, ValueError):
+			skill.install = None
+
+		skill.stamps[skill.installFile] = installFile.stat().st_mtime_ns
+		for walkedDirectory, directories, fileNames in os.walk(directory):
+			directories[:] = sorted(name for name in directories if name not in EXCLUDED_DIRECTORIES)
+			walked = Path(walkedDirectory)
+			skill.stamps[walked.relative_to(directory).as_posix()] = walked.stat().st_mtime_ns
+
+			for fileName in sorted(fileNames):
+				file = Path(walkedDirectory, fileName)
+				filePath = file.relative_to(directory).as_posix()
+				parent = file.parent.relative_to(directory).as_posix()
+
+				if file.suffix == '.py':
+					skill.sources.append(filePath)
+				elif file.suffix == '.sample':
+					skill.samples.append(filePath)
+				elif file.suffix == '.json' and parent == 'talks':
+					skill.talks[file.stem] = filePath
+				elif file.suffix == '.json' and parent == 'dialogTemplate':
+					skill.dialogTemplates[file.stem] = filePath
+
+		return skill
@@ -47,11 +47,18 @@
 from __future__ import annotations
 
 import re
-from dataclasses import dataclass
+from functools import lru_cache
+from typing import Iterable, List, NamedTuple
 
 
-@dataclass(order=True)
-class Version:
+VERSION_PATTERN = re.compile(r'(?P<mainVersion>\d+)\.(?P<updateVersion>\d+)(?:\.(?P<hotfix>\d+))?(?:-(?P<releaseType>a|b|rc)(?P<releaseNumber>\d+)?)?')
+
+
+class Version(NamedTuple):
+	"""
+	Versions are immutable tuples, ordered field by field, so comparing two versions is a plain
+	tuple comparison. Use `_replace` to get a modified copy
+	"""
 	mainVersion: int = 0
 	updateVersion: int = 0
 	hotfix: int = 0
@@ -62,7 +69,7 @@ class Version:
 
 	@property
 	def isVersionNumber(self):
-		return self > Version(0, 0, 0, '', 0)
+		return self > NO_VERSION
 
 
 	def __str__(self):
@@ -74,17 +81,32 @@ class Version:
 
 	@classmethod
 	def fromString(cls, versionString: str) -> Version:
-		versionMatch = re.search(
-			'(?P<mainVersion>\d+)\.(?P<updateVersion>\d+)(?:\.(?P<hotfix>\d+))?(?:-(?P<releaseType>a|b|rc)(?P<releaseNumber>\d+)?)?',
-			str(versionString))
-
-		# when the string is no version set the version to the lowest possible value
-		if not versionMatch:
-			return cls(0, 0, 0, '', 0)
-
-		return cls(
-			int(versionMatch.group('mainVersion')),
-			int(versionMatch.group('updateVersion')),
-			int(versionMatch.group('hotfix') or 0),
-			versionMatch.group('releaseType') or 'release',
-			int(versionMatch.group('releaseNumber') or 1))
+		return _parse(str(versionString))
+
+
+	@classmethod
+	def parseMany(cls, versionStrings: Iterable[str]) -> List[Version]:
+		return [_parse(str(versionString)) for versionString in versionStrings]
+
+
+# lowest possible version, used when a string is no version
+NO_VERSION = Version(0, 0, 0, '', 0)
+
+
+@lru_cache(maxsize=4096)
+def _parse(versionString: str) -> Version:
+	"""
+	Parsing is cached, the same string always gives the same instance
+	"""
+	versionMatch = VERSION_PATTERN.search(versionString)
+
+	# when the string is no version set the version to the lowest possible value
+	if not versionMatch:
+		return NO_VERSION
+
+	return Version(
+		int(versionMatch.group('mainVersion')),
+		int(versionMatch.group('updateVersion')),
+		int(versionMatch.group('hotfix') or 0),
+		versionMatch.group('releaseType') or 'release',
+		int(versionMatch.group('releaseNumber') or 1))
@@ -0,0 +1,143 @@
+#  Copyright (c) 2026
+#
+#  This file, NearDuplicates.py, is part of Project Alice.
+#
+#  Project Alice is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>
+#
+#  Last modified: 2026.10.18 at 10:00:00 CEST
+
+from __future__ import annotations
+
+import hashlib
+import json
+import random
+import re
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, Iterable, List, Set, Tuple
+
+
+MERSENNE_PRIME = (1 << 61) - 1
+SLOT_PATTERN = re.compile(r'{[^{}]*?:=>(?P<slotName>[^{}]*?)}')
+WORD_PATTERN = re.compile(r'<\w+>|\w+')
+
+
+def extractUtterances(content: bytes) -> List[Tuple[str, str]]:
+	"""
+	Lists every utterance of a dialog template as (intent name, utterance)
+	"""
+	return [
+		(intent['name'], utterance)
+		for intent in json.loads(content).get('intents', list())
+		for utterance in intent.get('utterances', list())
+	]
+
+
+def shingles(utterance: str) -> FrozenSet[str]:
+	"""
+	Words and word pairs of an utterance, lower cased. Slot values are replaced by their slot name,
+	as two utterances only differing by their slot values train the exact same thing
+	"""
+	text = SLOT_PATTERN.sub(lambda match: f' <{match.group("slotName")}> ', utterance.lower())
+	words = WORD_PATTERN.findall(text)
+	return frozenset(words + [f'{first} {second}' for first, second in zip(words, words[1:])])
+
+
+def jaccard(first: FrozenSet[str], second: FrozenSet[str]) -> float:
+	return len(first & second) / len(first | second)
+
+
+@dataclass(frozen=True)
+class Utterance:
+	location: str
+	text: str
+	shingles: FrozenSet[str]
+
+
+def identicalGroups(utterances: List[Utterance]) -> List[List[Utterance]]:
+	"""
+	Groups the utterances that have the exact same shingles, such as the ones only differing by their
+	slot values. Every group holds at least two utterances, in their original order
+	"""
+	groups: Dict[FrozenSet[str], List[Utterance]] = defaultdict(list)
+	for utterance in utterances:
+		if utterance.shingles:
+			groups[utterance.shingles].append(utterance)
+
+	return [group for group in groups.values() if len(group) > 1]
+
+
+class NearDuplicateFinder:
+	"""
+	Finds pairs of utterances whose shingle sets have a jaccard similarity of at least `threshold`,
+	without comparing every utterance to every other one. Each utterance gets a MinHash signature
+	of bands * rows hashes. Only utterances that share all the rows of at least one band end up in
+	the same bucket and are compared, the exact similarity of those candidates is then checked.
+	The more bands and the fewer rows, the more candidates are compared and the fewer pairs are missed
+	"""
+
+	def __init__(self, threshold: float = 0.8, bands: int = 16, rows: int = 4, seed: int = 0):
+		self._threshold = threshold
+		self._bands = bands
+		self._rows = rows
+		rand = random.Random(seed)
+		self._coefficients = [(rand.randrange(1, MERSENNE_PRIME), rand.randrange(0, MERSENNE_PRIME)) for _ in range(bands * rows)]
+		self._tokenHashes: Dict[str, int] = dict()
+
+
+	def _tokenHash(self, token: str) -> int:
+		tokenHash = self._tokenHashes.get(token)
+		if tokenHash is None:
+			tokenHash = int.from_bytes(hashlib.blake2b(token.encode(), digest_size=8).digest(), 'big')
+			self._tokenHashes[token] = tokenHash
+		return tokenHash
+
+
+	def signature(self, tokens: Iterable[str]) -> List[int]:
+		hashes = [self._tokenHash(token) for token in tokens]
+		return [min((a * tokenHash + b) % MERSENNE_PRIME for tokenHash in hashes) for a, b in self._coefficients]
+
+
+	def find(self, utterances: List[Utterance]) -> List[Tuple[float, Utterance, Utterance]]:
+		"""
+		Returns the near duplicate pairs, most similar first. Utterances with the exact same shingles
+		are only hashed and compared once, through the first of them, see `identicalGroups` for the others
+		"""
+		unique: Dict[FrozenSet[str], Utterance] = dict()
+		for utterance in utterances:
+			if utterance.shingles:
+				unique.setdefault(utterance.shingles, utterance)
+		utterances = list(unique.values())
+
+		buckets: Dict[tuple, List[int]] = defaultdict(list)
+		for index, utterance in enumerate(utterances):
+
+			signature = self.signature(utterance.shingles)
+			for band in range(self._bands):
+				rows = tuple(signature[band * self._rows:(band + 1) * self._rows])
+				buckets[(band, rows)].append(index)
+
+		candidates: Set[Tuple[int, int]] = set()
+		for indexes in buckets.values():
+			for i, first in enumerate(indexes):
+				candidates.update((first, second) for second in indexes[i + 1:])
+
+		pairs = list()
+		for first, second in candidates:
+			similarity = jaccard(utterances[first].shingles, utterances[second].shingles)
+			if similarity >= self._threshold:
+				pairs.append((similarity, utterances[first], utterances[second]))
+
+		pairs.sort(key=lambda pair: (-pair[0], pair[1].location, pair[2].location))
+		return pairs
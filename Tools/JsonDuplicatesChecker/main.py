@@ -45,31 +45,192 @@
 #  Last modified by: Psycho
 
 import json
+import sys
+import unicodedata
+from collections import defaultdict
 from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import click
+
+
+sys.path.append(str(Path(__file__).resolve().parent.parent / 'Common'))
+from FileCache import FileCache
+from NearDuplicates import NearDuplicateFinder, Utterance, extractUtterances, identicalGroups, shingles
+from SkillCatalogue import SkillCatalogue
+
+try:
+	import ijson
+except ImportError:
+	ijson = None
+
+
+def normalize(word: str) -> str:
+	"""
+	Case and accent insensitive form of a word, with collapsed whitespaces
+	"""
+	decomposed = unicodedata.normalize('NFKD', word.casefold())
+	return ' '.join(''.join(char for char in decomposed if not unicodedata.combining(char)).split())
+
+
+def extractSlotWords(content: bytes) -> List[Tuple[str, str, str]]:
+	"""
+	Lists every slot value and synonym of a dialog template as (slot type, slot value, word)
+	"""
+	words = list()
+	for slotType in json.loads(content).get('slotTypes', list()):
+		for slotValue in slotType.get('values', list()):
+			value = slotValue['value']
+			words.append((slotType['name'], value, value))
+			words.extend((slotType['name'], value, synonym) for synonym in slotValue.get('synonyms', list()))
+
+	return words
 
 
 class Checker:
 
-	def __init__(self):
+	def __init__(self, normalized: bool = False):
 		self._baseFile = Path('basejson.json')
+		self._normalized = normalized
+
+
+	def _key(self, word: str) -> str:
+		return normalize(word) if self._normalized else word
+
 
+	def iterWordlist(self, file: Path) -> Iterator[str]:
+		"""
+		Yields the words of a wordlist file. If ijson is installed, the file is parsed as a stream
+		instead of being loaded at once
+		"""
+		with file.open('rb') as fp:
+			if ijson:
+				for data in ijson.items(fp, 'wordlist.item'):
+					yield data['value']
+			else:
+				for data in json.load(fp)['wordlist']:
+					yield data['value']
 
-	def check(self):
-		with self._baseFile.open() as fp:
-			theList = json.load(fp)
 
-		newList = list()
-		for data in theList['wordlist']:
-			if data['value'] in newList:
-				print(f'Found a duplicated word: {data["value"]}')
+	def check(self, file: Optional[Path] = None) -> int:
+		"""
+		Checks a wordlist file for duplicated words, returns the amount of duplicates
+		"""
+		seen: Dict[str, int] = dict()
+		duplicates = 0
+		for index, word in enumerate(self.iterWordlist(file or self._baseFile)):
+			key = self._key(word)
+			if key in seen:
+				print(f'Found a duplicated word: {word} (entry {index}, first seen at entry {seen[key]})')
+				duplicates += 1
 				continue
 
-			newList.append(data['value'])
+			seen[key] = index
+
+		print(f'Checked {len(seen) + duplicates} words, found {duplicates} duplicated words')
+		return duplicates
+
+
+	def checkTemplates(self, skillRoot: Path, acrossSkills: bool = False, cache: bool = True) -> int:
+		"""
+		Checks the slot values and synonyms of every dialog template for duplicates. By default a
+		word may only appear once per slot type. Across skills, a word may only appear once per language
+		in all the slot types of all skills. Returns the amount of duplicated words
+		"""
+		occurrences: Dict[tuple, List[str]] = defaultdict(list)
+		with FileCache('slotWords', cache) as fileCache, SkillCatalogue(skillRoot, SkillCatalogue.CACHE_FILE if cache else None) as catalogue:
+			for template in catalogue.dialogTemplates():
+				try:
+					words = fileCache.get(template, extractSlotWords)
+				except (ValueError, KeyError, AttributeError):
+					print(f'Invalid dialog template {template}, skip')
+					continue
+
+				for slotType, value, word in words:
+					scope = (template.stem,) if acrossSkills else (str(template), slotType)
+					location = f'{template} > {slotType} > {value}' + (f' (synonym "{word}")' if word != value else '')
+					occurrences[scope + (self._key(word),)].append(location)
+
+		duplicates = {key: locations for key, locations in occurrences.items() if len(locations) > 1}
+		for key, locations in sorted(duplicates.items()):
+			print(f'Found a duplicated word: {key[-1]}')
+			for location in locations:
+				print(f'- {location}')
+
+		print(f'Found {len(duplicates)} duplicated words')
+		return len(duplicates)
+
+
+@click.group()
+def cli():
+	"""
+	This script checks word lists and slot values for duplicates
+	"""
+	pass
+
+
+@cli.command()
+@click.argument('file', default='basejson.json', type=click.Path(exists=True, dir_okay=False))
+@click.option('-n', '--normalize', 'normalized', is_flag=True, help='Ignore case and accents when comparing words')
+def wordlist(file: str, normalized: bool):
+	"""
+	Checks a wordlist json file for duplicated words
+	"""
+	if Checker(normalized).check(Path(file)):
+		sys.exit(1)
+
+
+@cli.command()
+@click.option('-r', '--root', default='../../PublishedSkills', type=click.Path(exists=True, file_okay=False), show_default=True, help='Where to look for dialog templates')
+@click.option('-n', '--normalize', 'normalized', is_flag=True, help='Ignore case and accents when comparing words')
+@click.option('-a', '--across-skills', is_flag=True, help='Look for duplicates across all slot types of all skills, per language')
+@click.option('--cache/--no-cache', default=True, show_default=True, help='Only parse the dialog templates that changed since the last run')
+def templates(root: str, normalized: bool, across_skills: bool, cache: bool):
+	"""
+	Checks the slot values and synonyms of every dialog template for duplicates
+	"""
+	if Checker(normalized).checkTemplates(Path(root), across_skills, cache):
+		sys.exit(1)
+
+
+@cli.command()
+@click.option('-r', '--root', default='../../PublishedSkills', type=click.Path(exists=True, file_okay=False), show_default=True, help='Where to look for dialog templates')
+@click.option('-t', '--threshold', default=0.8, type=click.FloatRange(0, 1), show_default=True, help='Minimum similarity of two utterances to be reported')
+@click.option('-b', '--bands', default=16, type=click.IntRange(min=1), show_default=True, help='MinHash bands, more bands find more pairs but cost more')
+@click.option('--rows', default=4, type=click.IntRange(min=1), show_default=True, help='MinHash rows per band, more rows compare fewer candidates')
+@click.option('--cache/--no-cache', default=True, show_default=True, help='Only parse the dialog templates that changed since the last run')
+def utterances(root: str, threshold: float, bands: int, rows: int, cache: bool):
+	"""
+	Finds near duplicated utterances, within and across the intents of all skills, per language.
+	Utterances that only differ by their slot values are reported once, as a group
+	"""
+	languages: Dict[str, List[Utterance]] = defaultdict(list)
+	with FileCache('utterances', cache) as fileCache, SkillCatalogue(Path(root), SkillCatalogue.CACHE_FILE if cache else None) as catalogue:
+		for template in catalogue.dialogTemplates():
+			try:
+				extracted = fileCache.get(template, extractUtterances)
+			except (ValueError, KeyError, AttributeError):
+				print(f'Invalid dialog template {template}, skip')
+				continue
+
+			for intent, text in extracted:
+				languages[template.stem].append(Utterance(f'{template} > {intent}', text, shingles(text)))
+
+	found = 0
+	finder = NearDuplicateFinder(threshold, bands, rows)
+	for language, languageUtterances in sorted(languages.items()):
+		groups = identicalGroups(languageUtterances)
+		pairs = finder.find(languageUtterances)
+		print(f'Checked {len(languageUtterances)} "{language}" utterances, found {len(groups)} groups of identical utterances and {len(pairs)} near duplicates')
+		for group in groups:
+			print('- 1.00 ' + ' ~ '.join(f'"{utterance.text}" ({utterance.location})' for utterance in group))
+		for similarity, first, second in pairs:
+			print(f'- {similarity:.2f} "{first.text}" ({first.location}) ~ "{second.text}" ({second.location})')
+		found += len(groups) + len(pairs)
 
-		print(len(newList))
-		print(newList)
+	if found:
+		sys.exit(1)
 
 
 if __name__ == '__main__':
-	checker = Checker()
-	checker.check()
+	cli()
@@ -45,13 +45,89 @@
 #  Last modified by: Psycho
 
 import json
+import re
+import sys
+from collections import defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
+from typing import Dict, FrozenSet, List, Optional, Set
 
 import click
 
+sys.path.append(str(Path(__file__).resolve().parent.parent / 'Common'))
+from FileCache import FileCache
+from SkillCatalogue import SkillCatalogue
+
 
 skillRoot = Path('../../PublishedSkills/')
 
+SLOT_PATTERN = re.compile(r'{(?P<value>[^{}]*?):=>(?P<slotName>[^{}]*?)}')
+WORD_PATTERN = re.compile(r'\w+')
+
+
+def plainText(utterance: str) -> str:
+	return SLOT_PATTERN.sub(lambda match: match.group('value'), utterance)
+
+
+def slotSignature(utterance: str) -> FrozenSet[str]:
+	return frozenset(match.group('slotName') for match in SLOT_PATTERN.finditer(utterance))
+
+
+def words(utterance: str) -> FrozenSet[str]:
+	return frozenset(WORD_PATTERN.findall(plainText(utterance).lower()))
+
+
+def diverseOrder(utterances: List[str], amount: int) -> List[str]:
+	"""
+	Picks up to amount utterances, each time the one bringing the most words not picked yet
+	"""
+	remaining = {utterance: words(utterance) for utterance in utterances}
+	seen: Set[str] = set()
+	picked: List[str] = list()
+	while remaining and len(picked) < amount:
+		utterance = max(remaining, key=lambda candidate: len(remaining[candidate] - seen))
+		seen |= remaining.pop(utterance)
+		picked.append(utterance)
+	return picked
+
+
+def pickSamples(utterances: List[str], amount: int) -> List[str]:
+	"""
+	Stratifies the utterances by the set of slots they use and picks from every stratum in turn,
+	the biggest first, so that every slot combination is represented before any gets a second sample
+	"""
+	strata: Dict[FrozenSet[str], List[str]] = defaultdict(list)
+	for utterance in dict.fromkeys(utterances):
+		strata[slotSignature(utterance)].append(utterance)
+
+	queues = deque(
+		deque(diverseOrder(stratum, amount))
+		for signature, stratum in sorted(strata.items(), key=lambda item: (-len(item[1]), sorted(item[0])))
+	)
+
+	picked: List[str] = list()
+	while queues and len(picked) < amount:
+		queue = queues.popleft()
+		picked.append(plainText(queue.popleft()))
+		if queue:
+			queues.append(queue)
+	return picked
+
+
+def sampleFileOf(dialogTemplate: Path) -> Path:
+	return Path(dialogTemplate.parent, f'{dialogTemplate.stem}.sample')
+
+
+def generateSamples(content: bytes, amount: int) -> Dict[str, List[str]]:
+	"""
+	Samples of every intent enabled by default, out of a dialog template's content
+	"""
+	return {
+		intent['name']: pickSamples(intent.get('utterances', list()), amount)
+		for intent in json.loads(content).get('intents', list())
+		if intent.get('enabledByDefault', True)
+	}
+
 
 @click.group()
 def cli():
@@ -62,19 +138,50 @@ def cli():
 
 
 @cli.command()
-def generate():
-	for dialogTemplate in skillRoot.rglob('dialogTemplate/*.json'):
-		if Path(dialogTemplate.parent, f'{dialogTemplate.stem}.sample').exists():
-			continue
-		# sample = dict()
-		# data = json.loads(dialogTemplate.read_text(encoding='utf-8'))
-		# for intent in data['intents']:
-		# 	if not intent['enabledByDefault']:
-		# 		continue
-		# 	sample[intent['name']] = list()
-
-		Path(dialogTemplate.parent, f'{dialogTemplate.stem}.sample').write_text(json.dumps(list(), indent='\t'))
-		print(f'Generated samples file for skill {dialogTemplate.parent.parent.stem} in "{dialogTemplate.stem}"')
+@click.option('-n', '--amount', default=10, show_default=True, help='Maximum amount of samples per intent')
+@click.option('-j', '--jobs', default=8, type=click.IntRange(min=1), show_default=True, help='Number of dialog templates processed in parallel')
+@click.option('--cache/--no-cache', default=True, show_default=True, help='Skip the dialog templates that did not change since the last run')
+@click.option('--overwrite', is_flag=True, help='Also rewrite the sample files that already exist, hand written ones included')
+def generate(amount: int, jobs: int, cache: bool, overwrite: bool):
+	"""
+	Writes a sample file next to every dialog template that has none yet, holding up to AMOUNT
+	utterances per intent enabled by default. Existing sample files are kept unless --overwrite
+	is given, and even then only written if their content changes
+	"""
+	with SkillCatalogue(skillRoot, SkillCatalogue.CACHE_FILE if cache else None) as catalogue:
+		templates = catalogue.dialogTemplates()
+
+	kept = 0
+	if not overwrite:
+		missing = [dialogTemplate for dialogTemplate in templates if not sampleFileOf(dialogTemplate).exists()]
+		kept = len(templates) - len(missing)
+		templates = missing
+
+	with ProcessPoolExecutor(max_workers=jobs) as processes, ThreadPoolExecutor(max_workers=jobs) as threads, FileCache(f'samples{amount}', cache) as fileCache:
+		def samplesOf(dialogTemplate: Path) -> Optional[Dict[str, List[str]]]:
+			try:
+				return fileCache.get(dialogTemplate, lambda content: processes.submit(generateSamples, content, amount).result())
+			except (OSError, ValueError, KeyError, TypeError) as e:
+				click.echo(f'Invalid dialog template "{dialogTemplate}": {e}', err=True)
+				return None
+
+		generated = unchanged = invalid = 0
+		for dialogTemplate, samples in zip(templates, threads.map(samplesOf, templates)):
+			if samples is None:
+				invalid += 1
+				continue
+
+			sampleFile = sampleFileOf(dialogTemplate)
+			content = json.dumps(samples, indent='\t', ensure_ascii=False)
+			if sampleFile.exists() and sampleFile.read_text(encoding='utf-8') == content:
+				unchanged += 1
+				continue
+
+			sampleFile.write_text(content, encoding='utf-8')
+			generated += 1
+			click.echo(f'Generated samples file for skill {dialogTemplate.parent.parent.stem} in "{dialogTemplate.stem}"')
+
+	click.echo(f'{generated} sample files written, {unchanged} unchanged, {kept} kept, {invalid} invalid dialog templates, {fileCache.hits} read from cache')
 
 
 if __name__ == '__main__':
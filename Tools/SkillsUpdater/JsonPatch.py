@@ -0,0 +1,159 @@
+#  Copyright (c) 2026
+#
+#  This file, JsonPatch.py, is part of Project Alice.
+#
+#  Project Alice is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>
+#
+#  Last modified: 2026.10.18 at 10:00:00 CEST
+
+from __future__ import annotations
+
+import json
+import re
+from dataclasses import dataclass
+from typing import Any, List, Tuple
+
+
+WHITESPACE = re.compile(r'[ \t\n\r]*')
+DECODER = json.JSONDecoder()
+
+
+@dataclass
+class Member:
+	key: str
+	keyStart: int
+	keyEnd: int
+	valueStart: int
+	valueEnd: int
+	value: Any
+
+
+@dataclass
+class JsonObject:
+	start: int
+	end: int
+	members: List[Member]
+
+
+def patch(content: str, data: Any) -> str:
+	"""
+	Returns `content` updated to hold `data`, changing only the spans of the values that differ.
+	Unchanged members keep their formatting byte for byte, new members are appended after the
+	last one with the indentation found in the file, removed ones are cut out with their separator
+	"""
+	indent = detectIndent(content)
+	start = _skipWhitespace(content, 0)
+	if not isinstance(data, dict) or not content.startswith('{', start):
+		return dumps(data, indent) + ('\n' if content.endswith('\n') else '')
+
+	edits: List[Tuple[int, int, str]] = list()
+	_patchObject(content, _scanObject(content, start), data, indent, edits)
+
+	for editStart, editEnd, replacement in sorted(edits, reverse=True):
+		content = f'{content[:editStart]}{replacement}{content[editEnd:]}'
+
+	return content
+
+
+def dumps(data: Any, indent: str, lineIndent: str = '') -> str:
+	return json.dumps(data, indent=indent, ensure_ascii=False).replace('\n', f'\n{lineIndent}')
+
+
+def detectIndent(content: str) -> str:
+	"""
+	The indentation of the first indented line, tabs if there is none
+	"""
+	match = re.search(r'\n([ \t]+)\S', content)
+	return match.group(1) if match else '\t'
+
+
+def _skipWhitespace(content: str, position: int) -> int:
+	match = WHITESPACE.match(content, position)
+	# the pattern also matches an empty string, it never fails
+	assert match
+	return match.end()
+
+
+def _same(first: Any, second: Any) -> bool:
+	return json.dumps(first, sort_keys=True) == json.dumps(second, sort_keys=True)
+
+
+def _lineIndent(content: str, position: int) -> str:
+	lineStart = content.rfind('\n', 0, position) + 1
+	return content[lineStart:_skipWhitespace(content, lineStart)].replace('\n', '').replace('\r', '')
+
+
+def _scanObject(content: str, start: int) -> JsonObject:
+	members: List[Member] = list()
+	position = _skipWhitespace(content, start + 1)
+	if content.startswith('}', position):
+		return JsonObject(start, position + 1, members)
+
+	while True:
+		key, keyEnd = DECODER.raw_decode(content, position)
+		valueStart = _skipWhitespace(content, keyEnd) + 1
+		valueStart = _skipWhitespace(content, valueStart)
+		value, valueEnd = DECODER.raw_decode(content, valueStart)
+		members.append(Member(key, position, keyEnd, valueStart, valueEnd, value))
+
+		position = _skipWhitespace(content, valueEnd)
+		if content.startswith('}', position):
+			return JsonObject(start, position + 1, members)
+
+		position = _skipWhitespace(content, position + 1)
+
+
+def _patchObject(content: str, jsonObject: JsonObject, data: dict, indent: str, edits: List[Tuple[int, int, str]]):
+	members = jsonObject.members
+	kept = [member for member in members if member.key in data]
+	closingIndent = _lineIndent(content, jsonObject.end - 1)
+
+	for member in kept:
+		value = data[member.key]
+		if _same(member.value, value):
+			continue
+
+		if isinstance(value, dict) and isinstance(member.value, dict):
+			_patchObject(content, _scanObject(content, member.valueStart), value, indent, edits)
+		else:
+			edits.append((member.valueStart, member.valueEnd, dumps(value, indent, _lineIndent(content, member.keyStart))))
+
+	known = {member.key for member in members}
+	added = [(key, value) for key, value in data.items() if key not in known]
+
+	if not kept:
+		if members or added:
+			memberIndent = closingIndent + indent
+			text = ''.join(f',\n{memberIndent}{json.dumps(key, ensure_ascii=False)}: {dumps(value, indent, memberIndent)}' for key, value in added)
+			edits.append((jsonObject.start + 1, jsonObject.end - 1, f'{text[1:]}\n{closingIndent}' if text else ''))
+		return
+
+	# members followed by a kept one are cut up to the next key, trailing ones after the last kept value
+	lastKept = members.index(kept[-1])
+	for index, member in enumerate(members[:lastKept]):
+		if member.key not in data:
+			edits.append((member.keyStart, members[index + 1].keyStart, ''))
+
+	if lastKept + 1 < len(members):
+		edits.append((kept[-1].valueEnd, members[-1].valueEnd, ''))
+
+	if not added:
+		return
+
+	last = kept[-1]
+	memberIndent = _lineIndent(content, last.keyStart)
+	separator = content[last.keyEnd:last.valueStart]
+	newline = f'\n{memberIndent}' if '\n' in content[jsonObject.start:last.keyStart] else ' '
+	text = ''.join(f',{newline}{json.dumps(key, ensure_ascii=False)}{separator}{dumps(value, indent, memberIndent)}' for key, value in added)
+	edits.append((last.valueEnd, last.valueEnd, text))
@@ -0,0 +1,163 @@
+#  Copyright (c) 2026
+#
+#  This file, Release.py, is part of Project Alice.
+#
+#  Project Alice is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>
+#
+#  Last modified: 2026.10.18 at 10:00:00 CEST
+
+from __future__ import annotations
+
+import json
+import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional
+
+from git import GitError, Repo
+
+sys.path.append(str(Path(__file__).resolve().parent.parent / 'Common'))
+from GitErrors import errorMessage
+
+
+class ReleaseError(Exception):
+	pass
+
+
+@dataclass
+class ReleaseResult:
+	"""
+	The status is the last step the skill went through, `committed`, `tagged` or `pushed`,
+	or `failed` with the error
+	"""
+	skill: str
+	tag: str = ''
+	status: str = 'pending'
+	error: str = ''
+
+
+	@property
+	def released(self) -> bool:
+		return self.status == 'pushed'
+
+
+def releaseTag(skillPath: Path) -> str:
+	"""
+	Tags are named `<skillVersion>_<aliceMinVersion>`, the format the store parses
+	"""
+	try:
+		data = json.loads((skillPath / f'{skillPath.name}.install').read_text(encoding='utf-8'))
+		return f'{data["version"]}_{data["aliceMinVersion"]}'
+	except (OSError, ValueError, KeyError) as e:
+		raise ReleaseError(f'Cannot read the install file: {e}')
+
+
+def releaseSkill(skillPath: Path, remote: str, message: str, branch: str = 'master') -> ReleaseResult:
+	"""
+	Commits the changes of the tracked files, tags the commit and pushes both. Untracked files are
+	never committed, new files have to be added first. Every step is skipped if it is already done,
+	so a failed release can simply be run again.
+	A skill checked out on a branch is pushed to that branch. A detached HEAD, as submodules are
+	checked out, is pushed to `branch`, which has to be a fast forward like any other push
+	"""
+	result = ReleaseResult(skillPath.name)
+	try:
+		repo = Repo(skillPath)
+		result.tag = releaseTag(skillPath)
+
+		if repo.is_dirty(untracked_files=False):
+			repo.git.add(update=True)
+			repo.git.commit(message=message.format(skill=result.skill, tag=result.tag))
+		result.status = 'committed'
+
+		existing = next((tag for tag in repo.tags if tag.name == result.tag), None)
+		if not existing:
+			repo.create_tag(result.tag)
+		elif existing.commit != repo.head.commit:
+			raise ReleaseError(f'Tag {result.tag} already exists on commit {existing.commit.hexsha[:8]}')
+		result.status = 'tagged'
+
+		target = branch if repo.head.is_detached else repo.active_branch.name
+		repo.git.push(remote, f'HEAD:refs/heads/{target}', f'refs/tags/{result.tag}')
+		result.status = 'pushed'
+	except (ReleaseError, GitError, ValueError) as e:
+		result.status = 'failed'
+		result.error = errorMessage(e)
+
+	return result
+
+
+class ReleaseState:
+	"""
+	Remembers the skills of the last release that are not pushed yet, they are picked up
+	again by the next release even if they have nothing left to commit
+	"""
+
+	def __init__(self, file: Path):
+		self._file = file
+		try:
+			self._pending: Dict[str, dict] = json.loads(file.read_text(encoding='utf-8'))
+		except (OSError, ValueError):
+			self._pending = dict()
+
+
+	@property
+	def pending(self) -> List[str]:
+		return sorted(self._pending)
+
+
+	def update(self, results: List[ReleaseResult]):
+		for result in results:
+			if result.released:
+				self._pending.pop(result.skill, None)
+			else:
+				self._pending[result.skill] = asdict(result)
+
+
+	def save(self):
+		if not self._pending:
+			try:
+				self._file.unlink()
+			except FileNotFoundError:
+				pass
+			return
+
+		self._file.parent.mkdir(parents=True, exist_ok=True)
+		self._file.write_text(json.dumps(self._pending, indent='\t', ensure_ascii=False), encoding='utf-8')
+
+
+def skillRepos(skillRoot: Path) -> Iterator[Path]:
+	for gitDir in sorted(skillRoot.glob('*/.git')):
+		yield gitDir.parent
+
+
+def changedSkills(skillRoot: Path) -> List[Path]:
+	return [skillPath for skillPath in skillRepos(skillRoot) if Repo(skillPath).is_dirty(untracked_files=False)]
+
+
+def release(skillPaths: List[Path], remote: str, message: str, jobs: int = 8, onResult: Optional[Callable[[ReleaseResult], None]] = None, branch: str = 'master') -> List[ReleaseResult]:
+	"""
+	Releases the skills concurrently, `onResult` is called as soon as a skill is done.
+	Results are returned in the order of the given paths
+	"""
+	results = dict()
+	with ThreadPoolExecutor(max_workers=jobs) as executor:
+		futures = {executor.submit(releaseSkill, skillPath, remote, message, branch): skillPath for skillPath in skillPaths}
+		for future in as_completed(futures):
+			results[futures[future]] = future.result()
+			if onResult:
+				onResult(results[futures[future]])
+
+	return [results[skillPath] for skillPath in skillPaths]
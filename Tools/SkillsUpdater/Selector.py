@@ -0,0 +1,105 @@
+#  Copyright (c) 2026
+#
+#  This file, Selector.py, is part of Project Alice.
+#
+#  Project Alice is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>
+#
+#  Last modified: 2026.10.18 at 10:00:00 CEST
+
+from __future__ import annotations
+
+import operator
+import re
+import sys
+from dataclasses import dataclass, field
+from fnmatch import fnmatch
+from pathlib import Path
+from typing import Callable, List, Optional, Tuple
+
+sys.path.append(str(Path(__file__).resolve().parent.parent / 'Common'))
+from Version import Version
+
+
+COMPARISON_PATTERN = re.compile(r'^\s*(?P<operator>>=|<=|==|!=|>|<)?\s*(?P<version>\S+)\s*$')
+OPERATORS = {
+	'>=': operator.ge,
+	'<=': operator.le,
+	'==': operator.eq,
+	'!=': operator.ne,
+	'>' : operator.gt,
+	'<' : operator.lt
+}
+
+
+@dataclass
+class VersionRange:
+	"""
+	Comma separated comparisons a version has to satisfy all, like `>=1.0.0,<1.2.0`.
+	A version without operator has to be equal
+	"""
+	comparisons: List[Tuple[Callable[[Version, Version], bool], Version]]
+
+
+	@classmethod
+	def fromString(cls, rangeString: str) -> VersionRange:
+		comparisons = list()
+		for part in rangeString.split(','):
+			match = COMPARISON_PATTERN.match(part)
+			if not match:
+				raise ValueError(f'Invalid version range "{rangeString}"')
+
+			version = Version.fromString(match.group('version'))
+			if not version.isVersionNumber:
+				raise ValueError(f'Invalid version range "{rangeString}"')
+
+			comparisons.append((OPERATORS[match.group('operator') or '=='], version))
+
+		return cls(comparisons)
+
+
+	def contains(self, version: Version) -> bool:
+		return all(compare(version, bound) for compare, bound in self.comparisons)
+
+
+@dataclass
+class Selector:
+	"""
+	Selects the skills a bulk operation applies to. Every criteria given has to match,
+	names are matched as case insensitive glob patterns
+	"""
+	names: Tuple[str, ...] = field(default_factory=tuple)
+	authors: Tuple[str, ...] = field(default_factory=tuple)
+	categories: Tuple[str, ...] = field(default_factory=tuple)
+	versionRange: Optional[VersionRange] = None
+	aliceMinRange: Optional[VersionRange] = None
+
+
+	def matchesPath(self, path: Path) -> bool:
+		return not self.names or any(fnmatch(path.stem.lower(), name.lower()) for name in self.names)
+
+
+	def matches(self, data: dict) -> bool:
+		if self.authors and data.get('author') not in self.authors:
+			return False
+
+		if self.categories and data.get('category') not in self.categories:
+			return False
+
+		if self.versionRange and not self.versionRange.contains(Version.fromString(data.get('version', ''))):
+			return False
+
+		if self.aliceMinRange and not self.aliceMinRange.contains(Version.fromString(data.get('aliceMinVersion', ''))):
+			return False
+
+		return True
@@ -18,17 +18,23 @@
 #  Last modified: 2021.07.28 at 16:35:11 CEST
 
 
-import json
 import os
-import shutil
+import sys
 from pathlib import Path
+from typing import Callable, List, Optional, Tuple
 
 import click
 
+from Release import ReleaseResult, ReleaseState, changedSkills, release
+from Selector import Selector, VersionRange
+from Transaction import InstallFile, Journal, Transaction, TransactionError
+
+sys.path.append(str(Path(__file__).resolve().parent.parent / 'Common'))
+from SkillCatalogue import SkillCatalogue
 from Version import Version
 
 
-backupDir = Path(os.path.dirname(os.path.abspath(__file__)), 'backup')
+journalDir = Path(os.path.dirname(os.path.abspath(__file__)), 'journal')
 skillRoot = Path('../../PublishedSkills/')
 
 
@@ -39,110 +45,251 @@ def cli():
 	It increments the target version number by 1
 	TARGET can be either `hotfix`, `feature` or `major`
 	Optionally you can specify an Alice min version to be set
+
+	Every run is journaled and can be reverted, see `history` and `revert`
+
+	The bulk operations apply to all skills unless narrowed down with the selection options.
+	Version ranges are comma separated comparisons, like `>=1.0.0,<1.2.0`
 	"""
 	pass
 
 
+def parseRange(ctx: click.Context, param: click.Parameter, value: Optional[str]) -> Optional[VersionRange]:
+	if not value:
+		return None
+
+	try:
+		return VersionRange.fromString(value)
+	except ValueError as e:
+		raise click.BadParameter(str(e))
+
+
+def transactionOptions(func: Callable) -> Callable:
+	options = [
+		click.option('--dry-run', is_flag=True, help='Only print the diff of every install file that would be rewritten'),
+		click.option('-j', '--jobs', default=8, type=click.IntRange(min=1), show_default=True, help='Number of install files read and written concurrently')
+	]
+	for option in reversed(options):
+		func = option(func)
+	return func
+
+
+def selectionOptions(func: Callable) -> Callable:
+	options = [
+		click.option('-n', '--name', multiple=True, help='Skill name glob pattern, can be repeated'),
+		click.option('--author', multiple=True, help='Skill author, can be repeated'),
+		click.option('--category', multiple=True, help='Skill category, can be repeated'),
+		click.option('--version', 'versionRange', callback=parseRange, help='Skill version range'),
+		click.option('--alice-min', 'aliceMinRange', callback=parseRange, help='Alice min version range')
+	]
+	for option in reversed(options):
+		func = option(func)
+	return transactionOptions(func)
+
+
+def buildSelector(name: Tuple[str, ...], author: Tuple[str, ...], category: Tuple[str, ...], versionRange: Optional[VersionRange], aliceMinRange: Optional[VersionRange]) -> Selector:
+	return Selector(names=name, authors=author, categories=category, versionRange=versionRange, aliceMinRange=aliceMinRange)
+
+
 @cli.command()
 @click.option('-t', '--target', default='hotfix', help='hotfix, feature or major')
 @click.option('-a', '--alicemin', help="If provided, sets Alice's min version")
-@click.option('-b', '--backup', default=False, help="Make a backup of the install files first")
-def update(target: str, alicemin: str, backup: bool):
+@selectionOptions
+def update(target: str, alicemin: str, dry_run: bool, jobs: int, **selection):
 	if target not in ['hotfix', 'feature', 'major']:
 		click.echo("Only 'hotfix', 'feature' or 'major' supported for target")
 		return
 
-	checkBackup(backup)
-
 	aliceMinVersion = Version.fromString(alicemin) if alicemin else None
 	if aliceMinVersion and str(aliceMinVersion) == '0.0.0-0':
 		click.echo('Invalid min alice version, aborting')
 		return
 
-	for installFile in installFiles():
-		doBackup(backup, installFile)
-
-		data = json.loads(installFile.read_text())
+	def edit(installFile: InstallFile):
+		data = installFile.data
 		version = Version.fromString(data['version'])
 
 		if target == 'hotfix':
-			version.hotfix += 1
+			version = version._replace(hotfix=version.hotfix + 1)
 		elif target == 'feature':
-			version.hotfix = 0
-			version.updateVersion += 1
+			version = version._replace(hotfix=0, updateVersion=version.updateVersion + 1)
 		elif target == 'major':
-			version.hotfix = 0
-			version.updateVersion = 0
-			version.mainVersion += 1
+			version = version._replace(hotfix=0, updateVersion=0, mainVersion=version.mainVersion + 1)
 
 		data['version'] = str(version)
 
 		if aliceMinVersion:
 			data['aliceMinVersion'] = str(aliceMinVersion)
 
-		installFile.write_text(json.dumps(data, indent=4, ensure_ascii=False))
-		click.echo(f'Rewritten "{installFile.stem}"')
+		installFile.rewrite(f'Rewritten "{installFile.path.stem}"')
+
+	runTransaction(f'update --target {target}' + (f' --alicemin {aliceMinVersion}' if aliceMinVersion else ''), edit, selector=buildSelector(**selection), dryRun=dry_run, jobs=jobs)
 
 
 @cli.command()
-def revert():
-	if not backupDir.exists():
-		click.echo('No backup found')
+@click.argument('run', required=False)
+@transactionOptions
+def revert(run: Optional[str], dry_run: bool, jobs: int):
+	"""
+	Reverts the install files changed by RUN, the last run if not given. Refuses to if any of
+	them was changed again since, by a later run or by hand
+	"""
+	journal = Journal(journalDir, skillRoot)
+	runs = [meta for meta in journal.runs() if meta['status'] in ('done', 'pending', 'partial')]
+	if not runs:
+		click.echo('Nothing to revert')
 		return
 
-	for file in backupDir.glob('*.install'):
-		shutil.copy(file, Path(skillRoot, file.stem, f'{file.stem}.install'))
-		click.echo(f'Reverted {file.stem}')
+	if run:
+		try:
+			meta = journal.run(run)
+		except KeyError:
+			click.echo(f'No run "{run}" found')
+			return
+	else:
+		meta = runs[-1]
+
+	try:
+		originals = journal.originals(meta['id'])
+		written = journal.written(meta['id'])
+	except OSError as e:
+		raise click.ClickException(f'Run {meta["id"]} cannot be reverted, its journal is incomplete: {e}')
+
+	def edit(installFile: InstallFile):
+		original = originals[installFile.path]
+		if installFile.content == original:
+			# never replaced by a partial run, or reverted already
+			return
+
+		if installFile.content != written[installFile.path]:
+			raise ValueError(f'"{installFile.path}" was changed since run {meta["id"]}, revert the later changes first')
+
+		installFile.updated = original
+		installFile.message = f'Reverted {installFile.path.stem}'
+
+	runTransaction(f'revert {meta["id"]}', edit, list(originals), dryRun=dry_run, jobs=jobs)
+	if not dry_run:
+		journal.setStatus(meta['id'], 'reverted')
 
 
 @cli.command()
-@click.argument('target', required=True)
-@click.option('-b', '--backup', default=False, help="Make a backup of the install files first")
-def droparg(target: str, backup: bool):
-	checkBackup(backup)
+def history():
+	"""
+	Lists the journaled runs
+	"""
+	for meta in Journal(journalDir, skillRoot).runs():
+		click.echo(f'{meta["id"]}  {meta["status"]:<8}  {len(meta["files"]):>3} files  {meta["command"]}')
+
 
-	for installFile in installFiles():
-		doBackup(backup, installFile)
+@cli.command()
+@click.argument('target', required=True)
+@selectionOptions
+def droparg(target: str, dry_run: bool, jobs: int, **selection):
+	def edit(installFile: InstallFile):
+		if target in installFile.data:
+			del installFile.data[target]
+			installFile.rewrite(f'Dropped "{target}" from "{installFile.path.stem}"')
 
-		data = json.loads(installFile.read_text())
-		if target in data:
-			del data[target]
-			installFile.write_text(json.dumps(data, indent=4, ensure_ascii=False))
-			click.echo(f'Dropped "{target}" from "{installFile.stem}"')
+	runTransaction(f'droparg {target}', edit, selector=buildSelector(**selection), dryRun=dry_run, jobs=jobs)
 
 
 @cli.command()
 @click.argument('target', required=True)
 @click.argument('value', required=True)
-@click.option('-b', '--backup', default=False, help="Make a backup of the install files first")
-def addarg(target: str, value: str, backup: bool):
-	checkBackup(backup)
+@selectionOptions
+def addarg(target: str, value: str, dry_run: bool, jobs: int, **selection):
+	def edit(installFile: InstallFile):
+		if target not in installFile.data:
+			installFile.data[target] = value
+			installFile.rewrite(f'Added "{target} = {value}" to "{installFile.path.stem}"')
+
+	runTransaction(f'addarg {target} {value}', edit, selector=buildSelector(**selection), dryRun=dry_run, jobs=jobs)
+
+
+@cli.command(name='release')
+@click.argument('skills', nargs=-1)
+@click.option('-m', '--message', default='Release {tag}', show_default=True, help='Commit message, {skill} and {tag} are replaced')
+@click.option('-r', '--remote', default='origin', show_default=True, help='Remote to push to')
+@click.option('-b', '--branch', default='master', show_default=True, help='Remote branch the skills with a detached HEAD are pushed to')
+@click.option('-j', '--jobs', default=8, type=click.IntRange(min=1), show_default=True, help='Number of skills released concurrently')
+@click.option('--dry-run', is_flag=True, help='Only list the skills that would be released')
+def releaseSkills(skills: Tuple[str, ...], message: str, remote: str, branch: str, jobs: int, dry_run: bool):
+	"""
+	Commits the changes to the tracked files of every changed skill, tags the commit
+	`<version>_<aliceMinVersion>` and pushes both. Untracked files are never committed.
+	Skills that failed to release last time are retried, already done steps are skipped.
+	Restrict the release to SKILLS if given
+	"""
+	state = ReleaseState(journalDir / 'release.json')
+	skillPaths = {skillPath.name: skillPath for skillPath in changedSkills(skillRoot)}
+	skillPaths.update({skill: skillRoot / skill for skill in state.pending})
+	if skills:
+		skillPaths = {skill: skillPath for skill, skillPath in skillPaths.items() if skill in skills}
+
+	if not skillPaths:
+		click.echo('Nothing to release')
+		return
+
+	if dry_run:
+		for skill in sorted(skillPaths):
+			click.echo(f'{skill}{"  (resumed)" if skill in state.pending else ""}')
+		return
+
+	def report(result: ReleaseResult):
+		click.echo(f'{result.skill:<30} {result.tag:<24} {result.status:<9} {result.error}')
+
+	results = release([skillPaths[skill] for skill in sorted(skillPaths)], remote, message, jobs, report, branch)
+	state.update(results)
+	state.save()
+
+	failed = [result.skill for result in results if not result.released]
+	click.echo(f'{len(results) - len(failed)} released, {len(failed)} failed')
+	if failed:
+		raise click.ClickException(f'Run release again to resume {", ".join(failed)}')
 
-	for installFile in installFiles():
-		doBackup(backup, installFile)
 
-		data = json.loads(installFile.read_text())
-		if target not in data:
-			data[target] = value
-			installFile.write_text(json.dumps(data, indent=4, ensure_ascii=False))
-			click.echo(f'Added "{target} = {value}" to "{installFile.stem}"')
+def runTransaction(command: str, edit: Callable[[InstallFile], None], paths: Optional[list] = None, selector: Optional[Selector] = None, dryRun: bool = False, jobs: int = 8):
+	if paths is None:
+		paths = [path for path in installFiles() if not selector or selector.matchesPath(path)]
+
+	if selector:
+		edit = selected(selector, edit)
+
+	transaction = Transaction(Journal(journalDir, skillRoot), command, jobs=jobs)
+	try:
+		changed = transaction.run(paths, edit, dryRun=dryRun)
+	except TransactionError as e:
+		for installFile in e.replaced:
+			click.echo(installFile.message)
+		raise click.ClickException(f'{e}. Only the {len(e.replaced)} install files above were changed, run {e.runId} can be reverted')
+	except (OSError, ValueError, KeyError) as e:
+		raise click.ClickException(f'Aborted, no install file was changed. {e}')
+
+	for installFile in changed:
+		if dryRun:
+			click.echo(installFile.diff(), nl=False)
+		else:
+			click.echo(installFile.message)
+
+	if dryRun:
+		click.echo(f'Dry run, {len(changed)} install files would be rewritten')
+		return
 
+	if transaction.runId:
+		click.echo(f'Journaled as run {transaction.runId}')
 
-def checkBackup(backup: bool):
-	if backup:
-		if backupDir.exists():
-			shutil.rmtree(backupDir)
-		backupDir.mkdir()
 
+def selected(selector: Selector, edit: Callable[[InstallFile], None]) -> Callable[[InstallFile], None]:
+	def selectedEdit(installFile: InstallFile):
+		if selector.matches(installFile.data):
+			edit(installFile)
 
-def doBackup(backup, file: Path):
-	if backup:
-		shutil.copy(file, backupDir)
+	return selectedEdit
 
 
-def installFiles():
-	for installFile in skillRoot.glob('**/*.install'):
-		yield installFile
+def installFiles() -> List[Path]:
+	with SkillCatalogue(skillRoot) as catalogue:
+		return catalogue.installFiles()
 
 
 if __name__ == '__main__':
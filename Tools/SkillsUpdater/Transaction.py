@@ -0,0 +1,259 @@
+#  Copyright (c) 2026
+#
+#  This file, Transaction.py, is part of Project Alice.
+#
+#  Project Alice is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>
+#
+#  Last modified: 2026.10.18 at 10:00:00 CEST
+
+from __future__ import annotations
+
+import difflib
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from JsonPatch import patch
+
+
+def readText(path: Path) -> str:
+	"""
+	Reads the file without newline translation, so that it can be written back byte for byte
+	"""
+	with path.open(encoding='utf-8', newline='') as fp:
+		return fp.read()
+
+
+def writeText(path: Path, content: str):
+	with path.open('w', encoding='utf-8', newline='') as fp:
+		fp.write(content)
+
+
+@dataclass
+class InstallFile:
+	path: Path
+	content: str
+	data: dict
+	updated: Optional[str] = None
+	message: str = ''
+
+
+	@classmethod
+	def load(cls, path: Path) -> InstallFile:
+		content = readText(path)
+		try:
+			return cls(path, content, json.loads(content))
+		except ValueError as e:
+			raise ValueError(f'Invalid install file "{path}": {e}')
+
+
+	@property
+	def changed(self) -> bool:
+		return self.updated is not None and self.updated != self.content
+
+
+	def diff(self) -> str:
+		# only changed files are diffed
+		assert self.updated is not None
+		diff = ''.join(difflib.unified_diff(
+			self.content.splitlines(keepends=True),
+			self.updated.splitlines(keepends=True),
+			fromfile=f'a/{self.path.as_posix()}',
+			tofile=f'b/{self.path.as_posix()}'
+		))
+		return diff if diff.endswith('\n') else f'{diff}\n'
+
+
+	def rewrite(self, message: str):
+		"""
+		To be called by edits once they changed the data. Only the edited values are rewritten,
+		the rest of the file keeps its formatting
+		"""
+		self.updated = patch(self.content, self.data)
+		self.message = message
+
+
+class TransactionError(Exception):
+	"""
+	Raised when writing failed after some install files were already replaced
+	"""
+
+	def __init__(self, message: str, runId: str, replaced: List[InstallFile]):
+		super().__init__(message)
+		self.runId = runId
+		self.replaced = replaced
+
+
+class Journal:
+	"""
+	Remembers, for every run that rewrote install files, what those files contained before and
+	what the run wrote. A run is `pending` until all its files are written, then `done`, or `partial`
+	if only some of them could be replaced, so even a run that crashed halfway can be reverted
+	"""
+
+	def __init__(self, root: Path, skillRoot: Path):
+		self._root = root
+		self._skillRoot = skillRoot
+
+
+	def runs(self) -> List[dict]:
+		if not self._root.exists():
+			return list()
+
+		runs = list()
+		for meta in sorted(self._root.glob('*/run.json')):
+			try:
+				runs.append(json.loads(meta.read_text(encoding='utf-8')))
+			except ValueError:
+				continue
+
+		return runs
+
+
+	def begin(self, command: str, installFiles: List[InstallFile]) -> str:
+		runId = datetime.now().strftime('%Y%m%d-%H%M%S-%f')
+		runDir = self._root / runId
+		files = list()
+		for installFile in installFiles:
+			# only changed files are journaled
+			assert installFile.updated is not None
+			relativePath = installFile.path.relative_to(self._skillRoot).as_posix()
+			for directory, content in (('files', installFile.content), ('written', installFile.updated)):
+				copy = runDir / directory / relativePath
+				copy.parent.mkdir(parents=True, exist_ok=True)
+				writeText(copy, content)
+			files.append(relativePath)
+
+		self._writeMeta(runId, {
+			'id'     : runId,
+			'command': command,
+			'status' : 'pending',
+			'files'  : files
+		})
+		return runId
+
+
+	def setStatus(self, runId: str, status: str):
+		meta = self.run(runId)
+		meta['status'] = status
+		self._writeMeta(runId, meta)
+
+
+	def run(self, runId: str) -> dict:
+		try:
+			return json.loads((self._root / runId / 'run.json').read_text(encoding='utf-8'))
+		except (OSError, ValueError):
+			raise KeyError(runId)
+
+
+	def originals(self, runId: str) -> Dict[Path, str]:
+		return self._contents(runId, 'files')
+
+
+	def written(self, runId: str) -> Dict[Path, str]:
+		return self._contents(runId, 'written')
+
+
+	def _contents(self, runId: str, directory: str) -> Dict[Path, str]:
+		return {
+			self._skillRoot / relativePath: readText(self._root / runId / directory / relativePath)
+			for relativePath in self.run(runId)['files']
+		}
+
+
+	def _writeMeta(self, runId: str, meta: dict):
+		(self._root / runId).mkdir(parents=True, exist_ok=True)
+		(self._root / runId / 'run.json').write_text(json.dumps(meta, indent='\t', ensure_ascii=False), encoding='utf-8')
+
+
+class Transaction:
+	"""
+	Applies an edit to many install files at once. All files are loaded concurrently and edited
+	in memory, nothing is written if any of them fails to load. The original contents are then
+	journaled, the new ones written to temporary files next to the install files and finally
+	renamed over them, which is atomic for every single file
+	"""
+
+	def __init__(self, journal: Journal, command: str, jobs: int = 8):
+		self._journal = journal
+		self._command = command
+		self._jobs = jobs
+		self.runId: Optional[str] = None
+
+
+	def run(self, paths: List[Path], edit: Callable[[InstallFile], None], dryRun: bool = False) -> List[InstallFile]:
+		"""
+		Returns the files that were changed by the edit. A dry run only edits in memory,
+		nothing is journaled nor written
+		"""
+		with ThreadPoolExecutor(max_workers=self._jobs) as executor:
+			installFiles = list(executor.map(InstallFile.load, paths))
+
+			for installFile in installFiles:
+				edit(installFile)
+
+			changed = [installFile for installFile in installFiles if installFile.changed]
+			if not changed or dryRun:
+				return changed
+
+			self.runId = self._journal.begin(self._command, changed)
+			try:
+				tmpFiles = list(executor.map(self._writeTmp, changed))
+			except Exception:
+				for installFile in changed:
+					self._discardTmp(installFile.path)
+				self._journal.setStatus(self.runId, 'aborted')
+				raise
+
+		replaced = list()
+		try:
+			for installFile, tmpFile in zip(changed, tmpFiles):
+				os.replace(tmpFile, installFile.path)
+				replaced.append(installFile)
+		except OSError as e:
+			failed = changed[len(replaced)]
+			for installFile in changed[len(replaced):]:
+				self._discardTmp(installFile.path)
+			self._journal.setStatus(self.runId, 'partial')
+			raise TransactionError(f'Replacing "{failed.path}" failed: {e}', self.runId, replaced)
+
+		self._journal.setStatus(self.runId, 'done')
+		return changed
+
+
+	@staticmethod
+	def _tmpFile(path: Path) -> Path:
+		return path.with_name(f'.{path.name}.tmp')
+
+
+	def _writeTmp(self, installFile: InstallFile) -> Path:
+		# only changed files are written
+		assert installFile.updated is not None
+		tmpFile = self._tmpFile(installFile.path)
+		with tmpFile.open('w', encoding='utf-8', newline='') as fp:
+			fp.write(installFile.updated)
+			fp.flush()
+			os.fsync(fp.fileno())
+		return tmpFile
+
+
+	def _discardTmp(self, path: Path):
+		try:
+			self._tmpFile(path).unlink()
+		except FileNotFoundError:
+			pass
@@ -0,0 +1,120 @@
+#  Copyright (c) 2026
+#
+#  This file, installWriterBenchmark.py, is part of Project Alice.
+#
+#  Project Alice is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>
+#
+#  Last modified: 2026.10.18 at 10:00:00 CEST
+
+from __future__ import annotations
+
+import copy
+import difflib
+import json
+import sys
+import timeit
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+import click
+
+from JsonPatch import patch
+from SkillUpdater import skillRoot
+
+sys.path.append(str(Path(__file__).resolve().parent.parent / 'Common'))
+from SkillCatalogue import SkillCatalogue
+from Version import Version
+
+
+def legacySerialize(content: str, data: dict) -> str:
+	"""
+	Install files as they were written before, kept as reference
+	"""
+	return json.dumps(data, indent=4, ensure_ascii=False)
+
+
+def bumpHotfix(data: dict):
+	version = Version.fromString(data.get('version', ''))
+	data['version'] = str(version._replace(hotfix=version.hotfix + 1))
+
+
+def addArg(data: dict):
+	data.setdefault('benchmark', 'value')
+
+
+def dropArg(data: dict):
+	data.pop('desc', None)
+
+
+EDITS: Dict[str, Callable[[dict], None]] = {
+	'hotfix' : bumpHotfix,
+	'addarg' : addArg,
+	'droparg': dropArg
+}
+
+
+def edited(files: List[Tuple[str, dict]], edit: Callable[[dict], None]) -> List[Tuple[str, dict]]:
+	editedFiles = list()
+	for content, data in files:
+		data = copy.deepcopy(data)
+		edit(data)
+		editedFiles.append((content, data))
+	return editedFiles
+
+
+def measure(files: List[Tuple[str, dict]], writer: Callable[[str, dict], str]) -> Tuple[int, int, int, int]:
+	"""
+	Returns the amount of rewritten files, the bytes written and the changed lines and bytes of their diffs
+	"""
+	rewritten = written = diffLines = diffBytes = 0
+	for content, data in files:
+		updated = writer(content, data)
+		if updated == content:
+			continue
+
+		rewritten += 1
+		written += len(updated.encode('utf-8'))
+		for line in difflib.unified_diff(content.splitlines(keepends=True), updated.splitlines(keepends=True), n=0):
+			if line[:1] in '+-' and line[:3] not in ('+++', '---'):
+				diffLines += 1
+				diffBytes += len(line.encode('utf-8'))
+
+	return rewritten, written, diffLines, diffBytes
+
+
+@click.command()
+@click.option('-r', '--root', default=str(skillRoot), show_default=True, help='Directory holding the skills')
+@click.option('--repeat', default=5, show_default=True, help='Best of that many runs is reported')
+def cli(root: str, repeat: int):
+	"""
+	Compares the format preserving install writer to the previous full reserialization,
+	for a few typical bulk edits, in memory. Nothing is written
+	"""
+	files = list()
+	for installFile in SkillCatalogue(Path(root)).installFiles():
+		content = installFile.read_text(encoding='utf-8')
+		files.append((content, json.loads(content)))
+
+	click.echo(f'{len(files)} install files')
+	click.echo(f'{"edit":<8} {"writer":<8} {"files":>6} {"written":>10} {"diff lines":>11} {"diff bytes":>11} {"time":>10}')
+	for name, edit in EDITS.items():
+		editedFiles = edited(files, edit)
+		for writerName, writer in (('legacy', legacySerialize), ('patch', patch)):
+			rewritten, written, diffLines, diffBytes = measure(editedFiles, writer)
+			duration = min(timeit.repeat(lambda: [writer(content, data) for content, data in editedFiles], number=1, repeat=repeat))
+			click.echo(f'{name:<8} {writerName:<8} {rewritten:>6} {written:>10} {diffLines:>11} {diffBytes:>11} {duration * 1000:>8.2f}ms')
+
+
+if __name__ == '__main__':
+	cli()
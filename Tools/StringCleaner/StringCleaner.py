@@ -44,84 +44,204 @@
 #  Last modified: 2020/9/7 16:45
 #  Last modified by: Psycho
 
+import ast
+import io
 import json
+import re
+import sys
+import tokenize
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Dict, Optional, Set
+
+import click
+
+
+sys.path.append(str(Path(__file__).resolve().parent.parent / 'Common'))
+from FileCache import FileCache
+from SkillCatalogue import SkillCatalogue
+
+
+QUOTED_STRING = re.compile(r'''(['"])(.*?)\1''')
+REFERENCE_LANGUAGE = 'en'
 
 
 class StringCleaner:
 
-	def __init__(self):
+	def __init__(self, jobs: int = 8, cache: bool = True):
 		self._skills = Path('../../PublishedSkills')
 		self._core = Path('../../../ProjectAlice/core')
+		self._jobs = jobs
+		self._talkCache = FileCache('talkKeys', cache)
+		self._literalCache = FileCache('stringLiterals', cache)
+		self._catalogue = SkillCatalogue(self._skills, SkillCatalogue.CACHE_FILE if cache else None)
 
-		self._langFR = dict()
-		self._langDE = dict()
-		self._languageStrings= dict()
+		# skill name -> language -> keys of its talk file
+		self._talks: Dict[str, Dict[str, Set[str]]] = dict()
+		# language -> key -> talks directory defining it
+		self._languages: Dict[str, Dict[str, Path]] = dict()
+		self._languageStrings: Dict[str, Path] = dict()
 
 
 	def loadLangFiles(self):
-		for p in self._skills.rglob('en.json'):
-			if p.parent.stem != 'talks':
-				continue
-			with p.open() as fp:
-				fileContent = json.load(fp)
-				dictionary = {key: p.parent for key in fileContent}
-				self._languageStrings = {**self._languageStrings, **dictionary}
+		"""
+		Loads the talk files of every language of every skill in parallel
+		"""
+		talkFiles = self._catalogue.talkFiles()
 
-		for p in self._skills.rglob('fr.json'):
-			if p.parent.stem != 'talks':
-				continue
-			with p.open() as fp:
-				fileContent = json.load(fp)
-				d = {key: p.parent for key in fileContent}
-				self._langFR = {**self._languageStrings, **d}
+		with ThreadPoolExecutor(max_workers=self._jobs) as executor:
+			for p, keys in zip(talkFiles, executor.map(self.loadTalkFile, talkFiles)):
+				if keys is None:
+					print(f'Invalid talk file {p}, skip')
+					continue
 
-		for p in self._skills.rglob('de.json'):
-			if p.parent.stem != 'talks':
-				continue
-			with p.open() as fp:
-				fileContent = json.load(fp)
-				d = {key: p.parent for key in fileContent}
-				self._langDE = {**self._languageStrings, **d}
+				language = p.stem
+				self._talks.setdefault(p.parent.parent.name, dict())[language] = keys
+				self._languages.setdefault(language, dict()).update((key, p.parent) for key in keys)
+
+		self._languageStrings = self._languages.get(REFERENCE_LANGUAGE, dict())
+
+
+	def loadTalkFile(self, p: Path) -> Optional[Set[str]]:
+		try:
+			return set(self._talkCache.get(p, lambda content: sorted(json.loads(content))))
+		except (OSError, ValueError):
+			return None
+
+
+	def saveCache(self):
+		self._talkCache.save()
+		self._literalCache.save()
+		self._catalogue.save()
 
 
 	def checkLangUsage(self):
+		literals = self.indexStringLiterals()
+
 		deprecated = dict()
 		for key, file in self._languageStrings.items():
-			try:
-				for p in self._skills.rglob('*.py'):
-					with p.open() as fp:
-						content = fp.read()
-						if f"'{key}'" in content and f'"{key}"' not in content:
-							raise Exception
-
-				for p in self._core.rglob('*.py'):
-					with p.open() as fp:
-						content = fp.read()
-						if f"'{key}'" in content and f'"{key}"' not in content:
-							raise Exception
-
-				deprecated[key] = file
-				print(f'Possible deprecated language string "{key}" in "{file}')
-			except:
+			if key in literals:
 				continue
 
+			deprecated[key] = file
+			print(f'Possible deprecated language string "{key}" in "{file}')
+
 		print(f'Found {len(deprecated)} possibly deprecated strings')
 
 
-	def checkTranslations(self):
-		for key, file in self._langFR.items():
-			if key not in self._languageStrings:
-				print(f'{key} in file {file} is not used in any en.json')
+	def indexStringLiterals(self) -> Set[str]:
+		"""
+		Collects the value of every string literal of every python file of the skills and the core,
+		so that language keys can be looked up without reading the files again
+		"""
+		literals = set()
+		for p in [*self._catalogue.sourceFiles(), *self._core.rglob('*.py')]:
+			literals.update(self._literalCache.get(p, lambda content: sorted(self.extractStringLiterals(content))))
 
-		for key, file in self._langDE.items():
-			if key not in self._languageStrings:
-				print(f'{key} in file {file} is not used in any en.json')
+		return literals
 
 
-if __name__ == '__main__':
-	cleaner = StringCleaner()
+	@staticmethod
+	def extractStringLiterals(source: bytes) -> Set[str]:
+		literals = set()
+		try:
+			for token in tokenize.tokenize(io.BytesIO(source).readline):
+				if token.type != tokenize.STRING:
+					continue
+
+				try:
+					value = ast.literal_eval(token.string)
+				except (ValueError, SyntaxError):
+					# f-strings cannot be evaluated
+					continue
+
+				if isinstance(value, str):
+					literals.add(value)
+		except (tokenize.TokenError, SyntaxError, UnicodeDecodeError):
+			# not valid python or not valid utf-8, fall back to anything that looks quoted
+			content = source.decode('utf-8', errors='ignore')
+			literals.update(match.group(2) for match in QUOTED_STRING.finditer(content))
+
+		return literals
+
+
+	def checkTranslations(self):
+		for language, strings in sorted(self._languages.items()):
+			if language == REFERENCE_LANGUAGE:
+				continue
+
+			for key, file in strings.items():
+				if key not in self._languageStrings:
+					print(f'{key} in file {file} is not used in any {REFERENCE_LANGUAGE}.json')
+
+
+	def skillLanguages(self) -> Dict[str, Set[str]]:
+		"""
+		The languages every skill supports: the ones its install file declares and the ones it has a
+		talk file or dialog template for
+		"""
+		languages = dict()
+		for skill in self._catalogue:
+			declared = ((skill.install or dict()).get('conditions') or dict()).get('lang', list())
+			languages[Path(skill.directory).name] = set(skill.languages) | (set(declared) if isinstance(declared, list) else set())
+
+		return languages
+
+
+	def coverage(self) -> dict:
+		"""
+		Compares every skill's talk files to its reference language one. For every language the skill
+		supports, lists the keys missing from and the keys extra to that language
+		"""
+		skillLanguages = self.skillLanguages()
+		skills = dict()
+		for skillName, talks in sorted(self._talks.items()):
+			reference = talks.get(REFERENCE_LANGUAGE, set())
+			skills[skillName] = {
+				language: {
+					'exists' : language in talks,
+					'missing': sorted(reference - talks.get(language, set())),
+					'extra'  : sorted(talks.get(language, set()) - reference)
+				}
+				for language in sorted(skillLanguages.get(skillName, set()) | set(talks))
+			}
+
+		return {
+			'reference': REFERENCE_LANGUAGE,
+			'languages': sorted({language for languages in skills.values() for language in languages}),
+			'skills'   : skills
+		}
+
+
+@click.command()
+@click.option('-c', '--coverage', 'coverageFile', type=click.Path(dir_okay=False, allow_dash=True), help='Only write the translation coverage of every skill and language as json to that file, - for stdout')
+@click.option('--fail-on-missing', is_flag=True, help='With --coverage, exit with an error if any translation of a language a skill supports is missing')
+@click.option('-j', '--jobs', default=8, type=click.IntRange(min=1), show_default=True, help='Amount of talk files loaded concurrently')
+@click.option('--cache/--no-cache', default=True, show_default=True, help='Only parse the files that changed since the last run')
+def main(coverageFile: Optional[str], fail_on_missing: bool, jobs: int, cache: bool):
+	"""
+	Checks for deprecated language strings and for translations that do not exist in english
+	"""
+	if fail_on_missing and not coverageFile:
+		raise click.UsageError('--fail-on-missing only works along with --coverage')
+
+	cleaner = StringCleaner(jobs, cache)
 	cleaner.loadLangFiles()
-	cleaner.checkLangUsage()
-	cleaner.checkTranslations()
 
+	if not coverageFile:
+		cleaner.checkLangUsage()
+		cleaner.checkTranslations()
+		cleaner.saveCache()
+		return
+
+	cleaner.saveCache()
+	report = cleaner.coverage()
+	with click.open_file(coverageFile, 'w', encoding='utf-8') as fp:
+		fp.write(json.dumps(report, ensure_ascii=False, indent='\t', sort_keys=True))
+
+	if fail_on_missing and any(entry['missing'] for languages in report['skills'].values() for entry in languages.values()):
+		sys.exit(1)
+
+
+if __name__ == '__main__':
+	main()
@@ -0,0 +1,81 @@
+#  Copyright (c) 2026
+#
+#  This file, BuildCache.py, is part of Project Alice.
+#
+#  Project Alice is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>
+#
+#  Last modified: 2026.10.18 at 10:00:00 CEST
+
+from __future__ import annotations
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Dict, Optional
+
+
+def contentHash(content: bytes) -> str:
+	return hashlib.sha1(content).hexdigest()
+
+
+class BuildCache:
+	"""
+	Remembers what the store build computed for every skill, along with the inputs it was computed
+	from. Entries are only reused if those inputs did not change. Entries that are not used during
+	a build are dropped when saving.
+	Samples are not cached, reading a cached payload back costs as much as reading the sample file
+	and keeping them would hold every skill's samples in memory
+	"""
+
+	VERSION = 2
+
+
+	def __init__(self, file: Path):
+		self._file = file
+		self._skills: Dict[str, dict] = dict()
+		self._newSkills: Dict[str, dict] = dict()
+
+		try:
+			content = json.loads(file.read_text(encoding='utf-8'))
+			if content.get('version') == self.VERSION:
+				self._skills = content['skills']
+		except (OSError, ValueError, KeyError):
+			pass
+
+
+	def getSkill(self, skillName: str, head: str, installHash: str, knownTags: set) -> Optional[dict]:
+		"""
+		Returns the cached entry for that skill if it was built off the same commit and install file,
+		and no known tag, local or on the remote, is missing from the tags the cached mapping was built with
+		"""
+		entry = self._skills.get(skillName)
+		if not entry or entry['head'] != head or entry['installHash'] != installHash:
+			return None
+
+		if not knownTags.issubset(entry['tags']):
+			return None
+
+		return entry
+
+
+	def putSkill(self, skillName: str, entry: dict):
+		self._newSkills[skillName] = entry
+
+
+	def save(self):
+		self._file.parent.mkdir(parents=True, exist_ok=True)
+		self._file.write_text(json.dumps({
+			'version': self.VERSION,
+			'skills' : self._newSkills
+		}, ensure_ascii=False, sort_keys=True), encoding='utf-8')
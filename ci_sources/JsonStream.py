@@ -0,0 +1,81 @@
+#  Copyright (c) 2026
+#
+#  This file, JsonStream.py, is part of Project Alice.
+#
+#  Project Alice is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>
+#
+#  Last modified: 2026.10.18 at 10:00:00 CEST
+
+from __future__ import annotations
+
+import json
+from typing import Any, Iterable, Optional, TextIO, Tuple
+
+
+def dumps(obj: Any) -> str:
+	"""
+	The one json format of the store files
+	"""
+	return json.dumps(obj, ensure_ascii=False, indent='\t', sort_keys=True)
+
+
+def dumpsMinified(obj: Any) -> str:
+	"""
+	Same as `dumps` without any whitespace
+	"""
+	return json.dumps(obj, ensure_ascii=False, separators=(',', ':'), sort_keys=True)
+
+
+class ObjectWriter:
+	"""
+	Writes a json object member by member, producing the exact same output as `dumps` or
+	`dumpsMinified` would for the whole object, without ever holding the whole object or its
+	serialization in memory. Members have to be written sorted by key
+	"""
+
+	def __init__(self, fp: TextIO, minified: bool = False):
+		self._fp = fp
+		self._minified = minified
+		self._previousKey: Optional[str] = None
+		self._fp.write('{')
+
+
+	def write(self, key: str, value: Any):
+		if self._previousKey is not None and key <= self._previousKey:
+			raise ValueError(f'Object members must be sorted and unique, got "{key}" after "{self._previousKey}"')
+
+		if self._minified:
+			self._fp.write('' if self._previousKey is None else ',')
+			self._fp.write(json.dumps(key, ensure_ascii=False))
+			self._fp.write(':')
+			self._fp.write(dumpsMinified(value))
+		else:
+			self._fp.write('\n\t' if self._previousKey is None else ',\n\t')
+			self._fp.write(json.dumps(key, ensure_ascii=False))
+			self._fp.write(': ')
+			# strings are escaped by json, so any new line in the output is indentation
+			self._fp.write(dumps(value).replace('\n', '\n\t'))
+
+		self._previousKey = key
+
+
+	def close(self):
+		self._fp.write('}' if self._minified or self._previousKey is None else '\n}')
+
+
+def dumpObject(fp: TextIO, members: Iterable[Tuple[str, Any]], minified: bool = False):
+	writer = ObjectWriter(fp, minified)
+	for key, value in members:
+		writer.write(key, value)
+	writer.close()
@@ -0,0 +1,111 @@
+#  Copyright (c) 2026
+#
+#  This file, LocalRepo.py, is part of Project Alice.
+#
+#  Project Alice is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>
+#
+#  Last modified: 2026.10.18 at 10:00:00 CEST
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Dict, List, Optional
+
+
+class LocalRepo:
+	"""
+	Reads refs straight out of a repository's git directory, loose refs and packed-refs,
+	without spawning any git process nor touching the network. Works for plain checkouts,
+	submodules, whose .git is a file pointing to the actual git directory, and worktrees
+	"""
+
+	def __init__(self, path: Path):
+		self._gitDir = self._findGitDir(path)
+
+		commonDir = self._gitDir / 'commondir'
+		if commonDir.exists():
+			self._commonDir = (self._gitDir / commonDir.read_text().strip()).resolve()
+		else:
+			self._commonDir = self._gitDir
+
+
+	@staticmethod
+	def _findGitDir(path: Path) -> Path:
+		dotGit = path / '.git'
+		if dotGit.is_dir():
+			return dotGit
+
+		if dotGit.is_file():
+			content = dotGit.read_text().strip()
+			if content.startswith('gitdir:'):
+				return (path / content[len('gitdir:'):].strip()).resolve()
+
+		raise FileNotFoundError(f'No git repository found in "{path}"')
+
+
+	def _packedRefs(self) -> Dict[str, str]:
+		refs = dict()
+		try:
+			with (self._commonDir / 'packed-refs').open() as fp:
+				for line in fp:
+					# skip the header and the peeled object lines of annotated tags
+					if line.startswith(('#', '^')):
+						continue
+
+					sha, _, ref = line.strip().partition(' ')
+					if ref:
+						refs[ref] = sha
+		except FileNotFoundError:
+			pass
+
+		return refs
+
+
+	def refs(self, prefix: str = 'refs/') -> Dict[str, str]:
+		"""
+		Returns the refs starting with prefix and the sha they point to. Loose refs take precedence
+		over packed ones, as git would do
+		"""
+		refs = {ref: sha for ref, sha in self._packedRefs().items() if ref.startswith(prefix)}
+
+		looseRefs = self._commonDir / prefix
+		if looseRefs.is_dir():
+			for file in looseRefs.rglob('*'):
+				if file.is_file():
+					refs[file.relative_to(self._commonDir).as_posix()] = file.read_text().strip()
+
+		return refs
+
+
+	def tags(self) -> List[str]:
+		return sorted(ref[len('refs/tags/'):] for ref in self.refs('refs/tags/'))
+
+
+	def resolve(self, ref: str) -> Optional[str]:
+		looseRef = self._commonDir / ref
+		if looseRef.is_file():
+			return looseRef.read_text().strip()
+
+		return self._packedRefs().get(ref)
+
+
+	def head(self) -> Optional[str]:
+		"""
+		Returns the sha of the checked out commit, None if the current branch has no commit yet
+		"""
+		content = (self._gitDir / 'HEAD').read_text().strip()
+		if content.startswith('ref:'):
+			return self.resolve(content[len('ref:'):].strip())
+
+		return content
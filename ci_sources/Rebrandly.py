@@ -0,0 +1,161 @@
+#  Copyright (c) 2026
+#
+#  This file, Rebrandly.py, is part of Project Alice.
+#
+#  Project Alice is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>
+#
+#  Last modified: 2026.10.18 at 10:00:00 CEST
+
+from __future__ import annotations
+
+import json
+import os
+import time
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Set
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+class RebrandlyClient:
+	"""
+	Small client for the Rebrandly links API, shared by the CI scripts.
+	It keeps one pooled session and retries failed requests with an exponential backoff.
+	If a cache file and a ttl are given, the full link listing is written to disk and
+	reused by every client created within the ttl, so a pipeline only pages through it once
+	"""
+
+	API_URL = 'https://api.rebrandly.com/v1'
+	CACHE_FILE = Path(__file__).parent.parent.resolve() / '.storeCache' / 'rebrandly.json'
+
+
+	def __init__(self, apiKey: Optional[str] = None, apiUrl: Optional[str] = None, cacheFile: Optional[Path] = CACHE_FILE, cacheTtl: int = 0, retries: int = 5, backoff: float = 0.5, timeout: float = 30):
+		self._apiUrl = (apiUrl or os.environ.get('RebrandlyApiUrl') or self.API_URL).rstrip('/')
+		self._cacheFile = cacheFile
+		self._cacheTtl = cacheTtl
+		self._timeout = timeout
+
+		self._session = requests.Session()
+		self._session.headers.update({
+			'Content-Type': 'application/json',
+			'apikey'      : apiKey or os.environ['RebrandlyApiKey']
+		})
+
+		adapter = HTTPAdapter(
+			pool_connections=1,
+			pool_maxsize=4,
+			max_retries=Retry(total=retries, backoff_factor=backoff, status_forcelist=(429, 500, 502, 503, 504))
+		)
+		self._session.mount('https://', adapter)
+		self._session.mount('http://', adapter)
+
+
+	def __enter__(self) -> RebrandlyClient:
+		return self
+
+
+	def __exit__(self, *args):
+		self.close()
+
+
+	def close(self):
+		self._session.close()
+
+
+	def pages(self, **params) -> Iterator[List[dict]]:
+		"""
+		Yields the link listing page by page, passing the id of the last link of a page as `last`
+		cursor to get the next one, until an empty page is returned. Extra query parameters, like
+		`orderBy` or `limit`, are passed along with every request
+		"""
+		while True:
+			response = self._session.get(f'{self._apiUrl}/links', params=params, timeout=self._timeout)
+			response.raise_for_status()
+			page = response.json()
+			if not page:
+				return
+
+			yield page
+			params['last'] = page[-1]['id']
+
+
+	def links(self) -> Iterator[dict]:
+		for page in self.pages():
+			yield from page
+
+
+	def snapshot(self) -> List[dict]:
+		"""
+		Returns every link, out of the local cache if it is still valid
+		"""
+		links = self._loadCache()
+		if links is None:
+			links = list(self.links())
+			self._saveCache(links)
+
+		return links
+
+
+	def clickCounts(self) -> Dict[str, int]:
+		return {link['slashtag']: link['clicks'] for link in self.snapshot()}
+
+
+	def slashtags(self) -> Set[str]:
+		return {link['slashtag'].lower() for link in self.snapshot()}
+
+
+	def findSlashtags(self, wanted: Set[str]) -> Set[str]:
+		"""
+		Returns which of the wanted slashtags exist, lower cased. Out of the local cache if it is still valid,
+		otherwise pages are requested, newest links first, only until all the wanted slashtags are found
+		"""
+		wanted = {slashtag.lower() for slashtag in wanted}
+		links = self._loadCache()
+		if links is not None:
+			return {link['slashtag'].lower() for link in links} & wanted
+
+		found: Set[str] = set()
+		if not wanted:
+			return found
+
+		for page in self.pages(orderBy='createdAt', orderDir='desc', limit=25):
+			found.update(wanted.intersection(link['slashtag'].lower() for link in page))
+			if found == wanted:
+				break
+
+		return found
+
+
+	def _loadCache(self) -> Optional[List[dict]]:
+		if not self._cacheFile or self._cacheTtl <= 0:
+			return None
+
+		try:
+			if time.time() - self._cacheFile.stat().st_mtime > self._cacheTtl:
+				return None
+			return json.loads(self._cacheFile.read_text(encoding='utf-8'))
+		except (OSError, ValueError):
+			return None
+
+
+	def _saveCache(self, links: List[dict]):
+		if not self._cacheFile or self._cacheTtl <= 0:
+			return
+
+		self._cacheFile.parent.mkdir(parents=True, exist_ok=True)
+		tmpFile = self._cacheFile.with_suffix('.tmp')
+		tmpFile.write_text(json.dumps(links, ensure_ascii=False), encoding='utf-8')
+		tmpFile.replace(self._cacheFile)
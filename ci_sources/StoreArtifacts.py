@@ -0,0 +1,123 @@
+#  Copyright (c) 2026
+#
+#  This file, StoreArtifacts.py, is part of Project Alice.
+#
+#  Project Alice is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>
+#
+#  Last modified: 2026.10.18 at 10:00:00 CEST
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+from pathlib import Path
+from typing import Dict, List
+
+import click
+
+from JsonStream import dumps
+
+
+try:
+	import brotli
+except ImportError:
+	brotli = None
+
+
+CHUNK_SIZE = 1024 * 1024
+MANIFEST = 'manifest.json'
+
+
+def minifiedName(file: Path) -> Path:
+	return file.with_name(f'{file.stem}.min{file.suffix}')
+
+
+def compress(file: Path) -> List[Path]:
+	"""
+	Writes a gzip and, if the brotli package is installed, a brotli compressed copy of the file.
+	The gzip header carries no timestamp, so unchanged content gives unchanged archives
+	"""
+	written = [file.with_name(f'{file.name}.gz')]
+	with file.open('rb') as source, written[0].open('wb') as raw, gzip.GzipFile(filename='', mode='wb', fileobj=raw, mtime=0) as target:
+		for chunk in iter(lambda: source.read(CHUNK_SIZE), b''):
+			target.write(chunk)
+
+	if brotli:
+		written.append(file.with_name(f'{file.name}.br'))
+		compressor = brotli.Compressor(quality=11)
+		with file.open('rb') as source, written[-1].open('wb') as target:
+			for chunk in iter(lambda: source.read(CHUNK_SIZE), b''):
+				target.write(compressor.process(chunk))
+			target.write(compressor.finish())
+
+	return written
+
+
+def fileHash(file: Path) -> str:
+	digest = hashlib.sha256()
+	with file.open('rb') as fp:
+		for chunk in iter(lambda: fp.read(CHUNK_SIZE), b''):
+			digest.update(chunk)
+	return digest.hexdigest()
+
+
+def buildManifest(storePath: Path) -> Dict[str, dict]:
+	"""
+	Lists every store artifact with its size and sha256, keyed by its path relative to the store
+	"""
+	manifest = dict()
+	for file in sorted(storePath.rglob('*')):
+		if not file.is_file() or file.name == MANIFEST:
+			continue
+
+		manifest[file.relative_to(storePath).as_posix()] = {
+			'sha256': fileHash(file),
+			'size'  : file.stat().st_size
+		}
+
+	return manifest
+
+
+def writeManifest(storePath: Path) -> Dict[str, dict]:
+	manifest = buildManifest(storePath)
+	(storePath / MANIFEST).write_text(dumps(manifest), encoding='utf-8')
+	return manifest
+
+
+def changedFiles(previous: Dict[str, dict], current: Dict[str, dict]) -> List[str]:
+	return [file for file, entry in current.items() if previous.get(file, dict()).get('sha256') != entry['sha256']]
+
+
+@click.command()
+@click.argument('previous', type=click.Path(dir_okay=False))
+@click.argument('current', type=click.Path(exists=True, dir_okay=False))
+def main(previous: str, current: str):
+	"""
+	Prints the artifacts of the CURRENT manifest that are new or changed since the PREVIOUS one,
+	followed by the manifest itself. A missing or invalid PREVIOUS manifest means everything changed
+	"""
+	try:
+		previousManifest = json.loads(Path(previous).read_text(encoding='utf-8'))
+	except (OSError, ValueError):
+		previousManifest = dict()
+
+	currentPath = Path(current)
+	for file in changedFiles(previousManifest, json.loads(currentPath.read_text(encoding='utf-8'))):
+		click.echo(file)
+	click.echo(currentPath.name)
+
+
+if __name__ == '__main__':
+	main()
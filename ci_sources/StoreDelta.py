@@ -0,0 +1,136 @@
+#  Copyright (c) 2026
+#
+#  This file, StoreDelta.py, is part of Project Alice.
+#
+#  Project Alice is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>
+#
+#  Last modified: 2026.10.18 at 10:00:00 CEST
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+
+def skillsDelta(previous: Dict[str, dict], current: Dict[str, dict]) -> dict:
+	"""
+	Describes what changed between two skill stores. For every new or modified skill, `set` holds
+	the fields that are new or have a new value and `unset` the fields that disappeared
+	"""
+	changed: Dict[str, Dict[str, Any]] = dict()
+	for skillName, data in current.items():
+		before = previous.get(skillName, dict())
+		fieldsSet = {field: value for field, value in data.items() if field not in before or before[field] != value}
+		fieldsUnset = sorted(field for field in before if field not in data)
+		if not fieldsSet and not fieldsUnset:
+			continue
+
+		changed[skillName] = {'set': fieldsSet}
+		if fieldsUnset:
+			changed[skillName]['unset'] = fieldsUnset
+
+	return {
+		'changed': changed,
+		'removed': sorted(skillName for skillName in previous if skillName not in current)
+	}
+
+
+class DeltaFeed:
+	"""
+	Keeps the last published skill store along with a store revision that is increased on every
+	build that changes something, and the deltas of the last `history` revisions.
+	A client at revision N applies, in order, every delta whose revision is greater than N.
+	If N is lower than `baseRevision` or greater than `revision`, it has to download the whole store again.
+
+	The previous store is kept in `file`, which may be lost between builds. The revision of the
+	feed that was actually published, if given, is therefore the floor of the revision: if `file`
+	is missing or older, the history is dropped and the revision goes on from the published one
+	"""
+
+	def __init__(self, file: Path, history: int, published: Optional[Path] = None):
+		self._file = file
+		self._history = history
+		self._revision = 0
+		self._skills: Dict[str, dict] = dict()
+		self._deltas: List[dict] = list()
+		self._known = False
+
+		try:
+			content = json.loads(file.read_text(encoding='utf-8'))
+			self._revision = content['revision']
+			self._skills = content['skills']
+			self._deltas = content['deltas']
+			self._known = True
+		except (OSError, ValueError, KeyError):
+			pass
+
+		publishedRevision = self.publishedRevision(published) if published else 0
+		if publishedRevision > self._revision or not self._known:
+			self._revision = max(self._revision, publishedRevision)
+			self._skills = dict()
+			self._deltas = list()
+			self._known = False
+
+
+	@staticmethod
+	def publishedRevision(file: Path) -> int:
+		"""
+		Reads the revision of a published skills.delta, 0 if there is none
+		"""
+		try:
+			return int(json.loads(file.read_text(encoding='utf-8'))['revision'])
+		except (OSError, ValueError, KeyError, TypeError):
+			return 0
+
+
+	@property
+	def revision(self) -> int:
+		return self._revision
+
+
+	def update(self, skillStore: Dict[str, dict]) -> bool:
+		"""
+		Records the new store, returns whether it differs from the previous one
+		"""
+		if self._known and skillStore == self._skills:
+			return False
+
+		self._revision += 1
+		if self._known:
+			delta = skillsDelta(self._skills, skillStore)
+			delta['revision'] = self._revision
+			self._deltas.append(delta)
+
+		self._deltas = self._deltas[-self._history:] if self._history > 0 else list()
+		self._skills = skillStore
+		self._known = True
+		return True
+
+
+	def feed(self) -> dict:
+		return {
+			'revision'    : self._revision,
+			'baseRevision': self._deltas[0]['revision'] - 1 if self._deltas else self._revision,
+			'deltas'      : self._deltas
+		}
+
+
+	def save(self):
+		self._file.parent.mkdir(parents=True, exist_ok=True)
+		self._file.write_text(json.dumps({
+			'revision': self._revision,
+			'skills'  : self._skills,
+			'deltas'  : self._deltas
+		}, ensure_ascii=False, sort_keys=True), encoding='utf-8')
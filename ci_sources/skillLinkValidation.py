@@ -44,46 +44,90 @@
 #  Last modified: 2020/10/3 16:17
 #  Last modified by: Psycho
 
-import os
 import sys
 from pathlib import Path
+from typing import Dict, Optional
 
 import click
-import requests
-
-
-skillLinks = []
-results = requests.get(
-	'https://api.rebrandly.com/v1/links',
-	headers={
-		'Content-Type': 'application/json',
-		'apikey'      : os.environ['RebrandlyApiKey']
-	}
-).json()
-clicks = [skill['slashtag'].lower() for skill in results]
-
-while clicks:
-	skillLinks += clicks
-	results = requests.get(
-		f"https://api.rebrandly.com/v1/links?last={results[-1]['id']}",
-		headers={
-			'Content-Type': 'application/json',
-			'apikey'      : os.environ['RebrandlyApiKey']
-		}
-	).json()
-	clicks = [skill['slashtag'].lower() for skill in results]
-
-skillStore = list()
+from git import GitCommandError, Repo
+
+from Rebrandly import RebrandlyClient
+
+sys.path.append(str(Path(__file__).resolve().parent.parent / 'Tools' / 'Common'))
+from SkillCatalogue import SkillCatalogue
+
+
 skillPath = Path('PublishedSkills')
+cachePath = Path(__file__).resolve().parent.parent / '.storeCache'
+NULL_SHA = '0' * 40
+
+
+def installChanged(skill: Path, before: str, after: str) -> bool:
+	"""
+	Whether the skill's install file changed between the two commits of its repository.
+	If they cannot be compared, a new skill or a commit not fetched, it is considered changed
+	"""
+	if before == NULL_SHA or not (skill / '.git').exists():
+		return True
+
+	try:
+		return bool(Repo(skill).git.diff(before, after, '--name-only', '--', '*.install'))
+	except GitCommandError:
+		return True
+
+
+def changedInstallers(commitRange: str) -> Dict[str, Path]:
+	"""
+	The install files changed in the commit range of this repository, either directly or within
+	a skill submodule whose commit changed
+	"""
+	changed = dict()
+	for line in Repo('.').git.diff(commitRange, '--raw', '--no-abbrev', '--', str(skillPath)).splitlines():
+		meta, path = line.split('\t', 1)
+		_, newMode, before, after, _ = meta.split(' ')
+		path = Path(path)
+
+		if newMode == '160000' and installChanged(path, before, after):
+			changed.update({installer.stem: installer for installer in path.glob('*.install')})
+		elif path.suffix == '.install' and path.exists():
+			changed[path.stem] = path
+
+	return changed
+
+
+@click.command()
+@click.option('--links-ttl', default=0, type=click.IntRange(min=0), envvar='RebrandlyCacheTtl', show_default=True, help='Seconds a cached Rebrandly link listing stays valid, 0 to always query the API')
+@click.option('--changed', 'commitRange', metavar='RANGE', help='Only check the skills whose install file changed in that commit range, like `HEAD~1..HEAD`')
+def main(links_ttl: int, commitRange: Optional[str]):
+	"""
+	Checks that every published skill has its install link
+	"""
+	if commitRange:
+		try:
+			installers = changedInstallers(commitRange)
+		except GitCommandError as e:
+			raise click.ClickException(f'Cannot list the changes of {commitRange}: {e.stderr.strip()}')
+
+		if not installers:
+			click.secho('No install file changed', fg='green', bold=True)
+			sys.exit(0)
+	else:
+		installers = {installer.stem: installer for installer in SkillCatalogue(skillPath, cachePath / 'catalogue.json').installFiles()}
+
+	with RebrandlyClient(cacheTtl=links_ttl) as rebrandly:
+		skillLinks = rebrandly.findSlashtags(set(installers))
+
+	err = 0
+	for skillName in sorted(installers):
+		if skillName.lower() not in skillLinks:
+			err = 1
+			click.secho(f'Install link for {skillName} does not exist yet', fg='red', bold=True)
+
+	if not err:
+		click.secho(f'All install links exist', fg='green', bold=True)
 
-err = 0
-for installer in skillPath.glob('*/*.install'):
-	skillName = installer.stem
-	if skillName.lower() not in skillLinks:
-		err = 1
-		click.secho(f'Install link for {skillName} does not exist yet', fg='red', bold=True)
+	sys.exit(err)
 
-if not err:
-	click.secho(f'All install links exist', fg='green', bold=True)
 
-sys.exit(err)
+if __name__ == '__main__':
+	main()
@@ -0,0 +1,132 @@
+#  Copyright (c) 2026
+#
+#  This file, skillZip.py, is part of Project Alice.
+#
+#  Project Alice is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>
+#
+#  Last modified: 2026.10.18 at 10:00:00 CEST
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from fnmatch import fnmatch
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+import click
+
+from BuildCache import contentHash
+
+sys.path.append(str(Path(__file__).resolve().parent.parent / 'Tools' / 'Common'))
+from SkillCatalogue import EXCLUDED_DIRECTORIES, SkillCatalogue
+
+
+repoRoot = Path(__file__).resolve().parent.parent
+skillPath = repoRoot / 'PublishedSkills'
+cachePath = repoRoot / '.storeCache'
+cacheFile = cachePath / 'skillZip.json'
+
+EXCLUDED_FILES = ('.git', '.gitignore', '.gitmodules', '.gitattributes', '*.pyc', '*.pyo', '.DS_Store', 'Thumbs.db')
+# zip files cannot hold dates before 1980
+FIXED_DATE = (1980, 1, 1, 0, 0, 0)
+
+
+def findSkills(cache: bool = True) -> List[Path]:
+	with SkillCatalogue(skillPath, cachePath / 'catalogue.json' if cache else None) as catalogue:
+		return [catalogue.path(skill) for skill in catalogue]
+
+
+def skillFiles(skill: Path) -> List[Tuple[str, Path]]:
+	"""
+	Lists the files to package as (archive name, path), sorted, without VCS metadata and caches
+	"""
+	files = list()
+	for directory, directories, fileNames in os.walk(skill):
+		directories[:] = [name for name in directories if name not in EXCLUDED_DIRECTORIES]
+		for fileName in fileNames:
+			if any(fnmatch(fileName, pattern) for pattern in EXCLUDED_FILES):
+				continue
+			file = Path(directory, fileName)
+			files.append((file.relative_to(skill).as_posix(), file))
+
+	return sorted(files)
+
+
+def package(skill: Path, archive: Path, previousHash: Optional[str]) -> Tuple[str, bool]:
+	"""
+	Writes a reproducible archive of the skill: sorted entries, fixed dates and permissions only
+	depending on whether a file is executable. Returns the hash of what was packaged and whether the
+	archive was written, it is not if that hash did not change and the archive exists
+	"""
+	files = [(name, file, file.read_bytes(), os.access(file, os.X_OK)) for name, file in skillFiles(skill)]
+	packageHash = contentHash(b'\0'.join(f'{name}:{executable}'.encode() + b'\0' + content for name, file, content, executable in files))
+	if packageHash == previousHash and archive.exists():
+		return packageHash, False
+
+	tmpArchive = archive.with_name(f'.{archive.name}.tmp')
+	with zipfile.ZipFile(tmpArchive, 'w') as zipFile:
+		for name, file, content, executable in files:
+			info = zipfile.ZipInfo(name, date_time=FIXED_DATE)
+			info.create_system = 3
+			info.external_attr = (0o100755 if executable else 0o100644) << 16
+			info.compress_type = zipfile.ZIP_DEFLATED
+			zipFile.writestr(info, content, compresslevel=9)
+
+	os.replace(tmpArchive, archive)
+	return packageHash, True
+
+
+@click.command()
+@click.argument('skills', nargs=-1)
+@click.option('-o', '--output', default='.', show_default=True, type=click.Path(file_okay=False), help='Directory the archives are written to')
+@click.option('-j', '--jobs', default=8, type=click.IntRange(min=1), show_default=True, envvar='STORE_JOBS', help='Number of skills packaged concurrently')
+@click.option('--cache/--no-cache', default=True, show_default=True, help='Skip the skills whose files did not change since the last run')
+def main(skills: Tuple[str, ...], output: str, jobs: int, cache: bool):
+	"""
+	Packages every skill, or only SKILLS if given, into <skill>.zip
+	"""
+	outputPath = Path(output)
+	outputPath.mkdir(parents=True, exist_ok=True)
+
+	try:
+		hashes = json.loads(cacheFile.read_text(encoding='utf-8')) if cache else dict()
+	except (OSError, ValueError):
+		hashes = dict()
+
+	skillDirs = [skill for skill in findSkills(cache) if not skills or skill.name in skills]
+
+	def run(skill: Path) -> Tuple[str, bool]:
+		return package(skill, outputPath / f'{skill.name}.zip', hashes.get(skill.name))
+
+	written = 0
+	with ThreadPoolExecutor(max_workers=jobs) as executor:
+		for skill, (packageHash, packaged) in zip(skillDirs, executor.map(run, skillDirs)):
+			hashes[skill.name] = packageHash
+			if packaged:
+				written += 1
+				click.echo(f'Packaged {skill.name}')
+
+	if cache:
+		cacheFile.parent.mkdir(parents=True, exist_ok=True)
+		cacheFile.write_text(json.dumps(hashes, indent='\t', sort_keys=True), encoding='utf-8')
+
+	click.echo(f'{written} skills packaged, {len(skillDirs) - written} unchanged')
+
+
+if __name__ == '__main__':
+	main()
@@ -1,28 +0,0 @@
-#
-# Copyright (c) 2021
-#
-# This file, skill_zip.sh, is part of Project Alice.
-#
-# Project Alice is free software: you can redistribute it and/or modify
-# it under the terms of the GNU General Public License as published by
-# the Free Software Foundation, either version 3 of the License, or
-# (at your option) any later version.
-#
-# This program is distributed in the hope that it will be useful,
-# but WITHOUT ANY WARRANTY; without even the implied warranty of
-# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
-# GNU General Public License for more details.
-#
-# You should have received a copy of the GNU General Public License
-# along with this program.  If not, see <https://www.gnu.org/licenses/>
-#
-# Last modified: 2021.06.25 at 16:43:07 CEST
-#
-
-shopt -s nullglob
-for skillpath in PublishedSkills/*/*/*.install; do
-    skillpath=$(dirname "${skillpath}")
-    cd "${skillpath}"
-    zip -r ../../../$(basename "${skillpath}") .
-    cd ../../..
-done
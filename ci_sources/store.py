@@ -47,16 +47,35 @@
 from __future__ import annotations
 
 import json
-import os
+import shutil
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
 from dataclasses import dataclass
+from functools import partial
 from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
-import requests
+import click
 from git import Repo
 
+import StoreArtifacts
+from BuildCache import BuildCache, contentHash
+from JsonStream import ObjectWriter, dumps
+from LocalRepo import LocalRepo
+from Rebrandly import RebrandlyClient
+from StoreDelta import DeltaFeed
+
+sys.path.append(str(Path(__file__).parent.parent.resolve() / 'Tools' / 'Common'))
+from SkillCatalogue import SkillCatalogue
 from Version import Version
 
 
+skillPath = Path('PublishedSkills')
+storePath = Path(__file__).parent.parent.resolve() / 'store'
+cachePath = Path(__file__).parent.parent.resolve() / '.storeCache'
+
+
 @dataclass
 class TagVersion:
 	skillVersion: Version
@@ -69,75 +88,273 @@ class TagVersion:
 		return cls(Version.fromString(skillVersion), Version.fromString(aliceMinVersion))
 
 
-clickCounts = dict()
-results = requests.get(
-	url='https://api.rebrandly.com/v1/links',
-	headers={
-		'Content-Type': 'application/json',
-		'apikey'      : os.environ['RebrandlyApiKey']
-	}
-).json()
-
-clicks = {skill['slashtag']: skill['clicks'] for skill in results}
-
-while clicks:
-	clickCounts.update(clicks)
-	results = requests.get(
-		url=f"https://api.rebrandly.com/v1/links?last={results[-1]['id']}",
-		headers={
-			'Content-Type': 'application/json',
-			'apikey'      : os.environ['RebrandlyApiKey']
-		}
-	).json()
-	clicks = {skill['slashtag']: skill['clicks'] for skill in results}
-
-skillStore = dict()
-skillPath = Path('PublishedSkills')
-storePath = Path(__file__).parent.parent.resolve() / 'store'
-storePath.mkdir(parents=True, exist_ok=True)
+def buildVersionMapping(tags: List[TagVersion]) -> Dict[str, str]:
+	"""
+	Maps Alice min versions to the newest skill version that can run on them. Going from the newest
+	skill version down, a tag is only kept if it needs a lower Alice version than the last kept one.
+	Sorting is stable, so among equal skill versions the first tag wins
+	"""
+	versions = dict()
+	aliceMaxVersion = None
+	for tag in sorted(tags, key=lambda p: p.skillVersion, reverse=True):
+		if aliceMaxVersion is None or tag.aliceMinVersion < aliceMaxVersion:
+			aliceMaxVersion = tag.aliceMinVersion
+			versions[str(tag.aliceMinVersion)] = str(tag.skillVersion)
 
-for installer in skillPath.glob('*/*.install'):
-	skillName = installer.stem
-	print(f'Building for "{skillName}"')
+	return versions
 
-	skillRepo = Repo(installer.parent)
-	skillRepo.remote().fetch('--tags')
-	tags = [TagVersion.fromString(tag) for tag in skillRepo.tags if '_' in str(tag)]
 
-	versions = dict()
-	while tags:
-		maxVersion = max(tags, key=lambda p: p.skillVersion)
-		tags = [tag for tag in tags if tag.aliceMinVersion < maxVersion.aliceMinVersion]
-		versions[str(maxVersion.aliceMinVersion)] = str(maxVersion.skillVersion)
+def buildCompatibilityIndex(skillTags: Dict[str, List[TagVersion]]) -> Dict[str, Dict[str, str]]:
+	"""
+	For every Alice version found in the tags of any skill, lists the newest version of every skill
+	that can be installed on it. All tags are sorted once by Alice version and swept in that order,
+	keeping track of the newest skill versions seen so far
+	"""
+	releases = sorted(
+		(tag.aliceMinVersion, skillName, tag.skillVersion)
+		for skillName, tags in skillTags.items()
+		for tag in tags
+	)
+
+	newest: Dict[str, Version] = dict()
+	index = dict()
+	for i, (aliceVersion, skillName, skillVersion) in enumerate(releases):
+		if skillName not in newest or newest[skillName] < skillVersion:
+			newest[skillName] = skillVersion
+
+		if i + 1 == len(releases) or releases[i + 1][0] != aliceVersion:
+			index[str(aliceVersion)] = {name: str(version) for name, version in newest.items()}
+
+	return index
+
+
+def isStale(data: dict, tagNames: List[str]) -> bool:
+	"""
+	A skill's local tags are considered stale if none of them is for the version its install file declares
+	"""
+	version = Version.fromString(data.get('version', ''))
+	return all(TagVersion.fromString(tag).skillVersion != version for tag in tagNames if '_' in tag)
+
 
-	print(f'- Version mapping: {versions}')
+def remoteTags(repo: Repo) -> Set[str]:
+	"""
+	The tag names of the remote, listed without fetching anything
+	"""
+	tags = set()
+	for line in str(repo.git.ls_remote('--tags', repo.remote().name)).splitlines():
+		ref = line.split('\t')[-1]
+		if ref.startswith('refs/tags/'):
+			tags.add(ref[len('refs/tags/'):].replace('^{}', ''))
+	return tags
 
-	try:
-		downloads = clickCounts[skillName]
-	except KeyError:
-		downloads = 0
 
-	with installer.open() as json_file:
-		data = json.load(json_file)
-		data['downloads'] = downloads
+def buildSkill(installer: Path, cache: Optional[BuildCache] = None, tagMode: str = 'fetch') -> Tuple[dict, bool]:
+	"""
+	Resolves the tags of one skill and maps them to versions. Tags are read from the local refs and,
+	depending on the tag mode, fetched first always (fetch), only if the local ones are stale (auto)
+	or never (local). This is the network bound part of the store build and is safe to run from a
+	worker thread. If the skill did not change since the cached build, the cached entry is returned as is.
+	In fetch mode, the tags of the remote are listed first and count as change as well
+	"""
+	localRepo = LocalRepo(installer.parent)
+	installContent = installer.read_bytes()
+	head = localRepo.head()
+	installHash = contentHash(installContent)
+	tagNames = localRepo.tags()
+
+	# a repository without any commit has no head to key the cache with
+	if cache and head:
+		knownTags = set(tagNames)
+		if tagMode == 'fetch':
+			knownTags |= remoteTags(Repo(installer.parent))
+
+		entry = cache.getSkill(installer.stem, head, installHash, knownTags)
+		if entry:
+			return entry, True
+
+	data = json.loads(installContent)
+	if tagMode == 'fetch' or (tagMode == 'auto' and isStale(data, tagNames)):
+		Repo(installer.parent).remote().fetch(tags=True)
+		tagNames = localRepo.tags()
+
+	tags = [TagVersion.fromString(tag) for tag in tagNames if '_' in tag]
+
+	return {
+		'head'          : head,
+		'installHash'   : installHash,
+		'tags'          : tagNames,
+		'data'          : data,
+		'versionMapping': buildVersionMapping(tags)
+	}, False
+
+
+def buildStore(catalogue: SkillCatalogue, clickCounts: Dict[str, int], jobs: int = 1, cache: Optional[BuildCache] = None, tagMode: str = 'fetch') -> Tuple[dict, Dict[str, List[TagVersion]]]:
+	"""
+	Builds the store content and returns it along with the version tags of every skill.
+	With more than one job the skills are built by a bounded pool of workers, results are
+	still merged in installer order so the output is identical
+	"""
+	installers = catalogue.installFiles()
+	build = partial(buildSkill, cache=cache, tagMode=tagMode)
+
+	results: Iterable[Tuple[dict, bool]]
+	if jobs > 1:
+		with ThreadPoolExecutor(max_workers=jobs) as executor:
+			results = list(executor.map(build, installers))
+	else:
+		results = map(build, installers)
+
+	skillStore = dict()
+	skillTags = dict()
+	for installer, (entry, cached) in zip(installers, results):
+		skillName = installer.stem
+		versions = entry['versionMapping']
+		print(f'Building for "{skillName}"{" (cached)" if cached else ""}')
+		print(f'- Version mapping: {versions}')
+
+		if cache:
+			cache.putSkill(skillName, entry)
+
+		data = dict(entry['data'])
+		data['downloads'] = clickCounts.get(skillName, 0)
 		data['versionMapping'] = versions
 		skillStore[data['name']] = data
+		skillTags[data['name']] = [TagVersion.fromString(tag) for tag in entry['tags'] if '_' in tag]
+
+	return skillStore, skillTags
+
+
+def findSamples(catalogue: SkillCatalogue) -> Dict[str, Dict[str, List[Path]]]:
+	"""
+	Lists the sample files per skill and language, without reading them
+	"""
+	found: Dict[str, Dict[str, List[Path]]] = dict()
+	for sample in catalogue.sampleFiles():
+		skillName = sample.parent.parent.stem
+		print(f'Found {sample.stem}.sample for skill {skillName}')
+		found.setdefault(str(skillName), dict()).setdefault(sample.stem, list()).append(sample)
+
+	return found
+
+
+def iterSamples(catalogue: SkillCatalogue) -> Iterator[Tuple[str, Dict[str, Any]]]:
+	"""
+	Yields the samples of one skill after the other, sorted by skill name, so that only one
+	skill's samples are held in memory at a time. If a language has several sample files,
+	the last valid one wins
+	"""
+	print('Generating samples file')
+	found = findSamples(catalogue)
+
+	for skillName in sorted(found):
+		samples = dict()
+		for language, sampleFiles in found[skillName].items():
+			for sample in sampleFiles:
+				try:
+					samples[language] = json.loads(sample.read_bytes())
+				except:
+					print(f'Invalid sample file {sample}, skip')
+
+		if samples:
+			yield skillName, samples
+
+
+def shardSamples(samples: Iterator[Tuple[str, Dict[str, Any]]]) -> Iterator[Tuple[str, Dict[str, Any]]]:
+	"""
+	Writes every skill's samples to store/samples/<skill>/<language>.json while passing them through
+	"""
+	shardPath = storePath / 'samples'
+	if shardPath.exists():
+		shutil.rmtree(shardPath)
+
+	for skillName, languages in samples:
+		skillShardPath = shardPath / skillName
+		skillShardPath.mkdir(parents=True)
+		for language, intentsSamples in languages.items():
+			(skillShardPath / f'{language}.json').write_text(dumps(intentsSamples), encoding='utf-8')
+
+		yield skillName, languages
+
+
+def writeStoreFile(file: Path, members: Iterable[Tuple[str, Any]], minified: bool = False):
+	"""
+	Streams the members to the store file and, if asked, at the same time to its minified variant
+	"""
+	with ExitStack() as stack:
+		writers = [ObjectWriter(stack.enter_context(file.open('w', encoding='utf-8')))]
+		if minified:
+			writers.append(ObjectWriter(stack.enter_context(StoreArtifacts.minifiedName(file).open('w', encoding='utf-8')), minified=True))
+
+		for key, value in members:
+			for writer in writers:
+				writer.write(key, value)
+
+		for writer in writers:
+			writer.close()
+
+
+@click.command()
+@click.option('-j', '--jobs', default=1, type=click.IntRange(min=1), envvar='STORE_JOBS', show_default=True, help='Amount of skills fetched and mapped concurrently')
+@click.option('--cache/--no-cache', default=True, show_default=True, help='Reuse what was built for unchanged skills during the previous build')
+@click.option('--links-ttl', default=0, type=click.IntRange(min=0), envvar='RebrandlyCacheTtl', show_default=True, help='Seconds a cached Rebrandly link listing stays valid, 0 to always query the API')
+@click.option('--shard-samples', is_flag=True, help='Also write the samples per skill and language to store/samples/<skill>/<language>.json')
+@click.option('--compress', is_flag=True, help='Also write minified and compressed variants of the store files and a manifest of their hashes')
+@click.option('--delta-history', default=20, type=click.IntRange(min=0), show_default=True, help='Amount of store revisions kept in the skills.delta feed, 0 to not write the feed')
+@click.option('--published-delta', type=click.Path(dir_okay=False), help='The skills.delta currently published, its revision is never gone back on. Defaults to the one in the store directory')
+@click.option('--tags', 'tagMode', default='fetch', type=click.Choice(['fetch', 'auto', 'local']), envvar='STORE_TAGS', show_default=True, help='Fetch the skill tags before reading them always, only for skills whose local tags are stale, or never')
+def main(jobs: int, cache: bool, links_ttl: int, shard_samples: bool, compress: bool, delta_history: int, published_delta: Optional[str], tagMode: str):
+	"""
+	Builds the skill store files out of the published skills
+	"""
+	storePath.mkdir(parents=True, exist_ok=True)
+	buildCache = BuildCache(cachePath / 'build.json') if cache else None
+
+	with RebrandlyClient(cacheTtl=links_ttl) as rebrandly:
+		clickCounts = rebrandly.clickCounts()
+
+	catalogue = SkillCatalogue(skillPath, cachePath / 'catalogue.json' if cache else None)
+	print(f'Found {len(catalogue)} skills, {len(catalogue.rescanned)} of them scanned')
+
+	skillStore, skillTags = buildStore(catalogue, clickCounts, jobs, buildCache, tagMode)
+
+	storeFile = (storePath / f'skills.json')
+	writeStoreFile(storeFile, sorted(skillStore.items()), compress)
+
+	compatibilityFile = (storePath / f'skills.compat')
+	writeStoreFile(compatibilityFile, sorted(buildCompatibilityIndex(skillTags).items()), compress)
+	storeFiles = [storeFile, compatibilityFile]
+
+	deltaFeed = None
+	if delta_history:
+		deltaFile = (storePath / f'skills.delta')
+		deltaFeed = DeltaFeed(cachePath / 'store.json', delta_history, Path(published_delta) if published_delta else deltaFile)
+		if deltaFeed.update(skillStore):
+			print(f'Store changed, now at revision {deltaFeed.revision}')
+
+		writeStoreFile(deltaFile, sorted(deltaFeed.feed().items()), compress)
+		storeFiles.append(deltaFile)
+
+	samples = iterSamples(catalogue)
+	if shard_samples:
+		samples = shardSamples(samples)
+
+	sampleStoreFile = (storePath / f'skills.samples')
+	writeStoreFile(sampleStoreFile, samples, compress)
+	storeFiles.append(sampleStoreFile)
+
+	if compress:
+		for file in storeFiles:
+			StoreArtifacts.compress(StoreArtifacts.minifiedName(file))
+		print(f'Written manifest for {len(StoreArtifacts.writeManifest(storePath))} store artifacts')
+
+	if buildCache:
+		buildCache.save()
+
+	catalogue.save()
+
+	if deltaFeed:
+		deltaFeed.save()
+
 
-print('Generating samples file')
-samples = dict()
-for sample in skillPath.rglob('*.sample'):
-	skillName = sample.parent.parent.stem
-	print(f'Found {sample.stem}.sample for skill {skillName}')
-	language = sample.stem
-	try:
-		intentsSamples = json.loads(sample.read_text())
-		samples.setdefault(str(skillName), dict())
-		samples[str(skillName)][language] = intentsSamples
-	except:
-		print('Invalid sample file, skip')
-
-storeFile = (storePath / f'skills.json')
-storeFile.write_text(json.dumps(skillStore, ensure_ascii=False, indent='\t', sort_keys=True))
-
-sampleStoreFile = (storePath / f'skills.samples')
-sampleStoreFile.write_text(json.dumps(samples, ensure_ascii=False, indent='\t', sort_keys=True))
+if __name__ == '__main__':
+	main()
@@ -0,0 +1,167 @@
+#  Copyright (c) 2026
+#
+#  This file, typecheck.py, is part of Project Alice.
+#
+#  Project Alice is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>
+#
+#  Last modified: 2026.10.18 at 10:00:00 CEST
+
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import click
+
+from BuildCache import contentHash
+
+sys.path.append(str(Path(__file__).resolve().parent.parent / 'Tools' / 'Common'))
+from SkillCatalogue import EXCLUDED_DIRECTORIES
+
+
+repoRoot = Path(__file__).resolve().parent.parent
+skillPath = repoRoot / 'PublishedSkills'
+mypyCache = repoRoot / '.mypy_cache'
+cachePath = repoRoot / '.storeCache'
+resultsFile = cachePath / 'typecheck.json'
+configFile = repoRoot / 'mypy.ini'
+
+
+@dataclass
+class CheckResult:
+	skill: str
+	hash: str
+	amount: int
+	success: bool
+	output: str
+
+
+	def report(self) -> str:
+		if self.success:
+			return f'{self.skill}: ' + click.style(f'Success: no issues found in {self.amount} source file', fg='green')
+		return f'{self.skill}: ' + click.style(f'\n{self.output}', fg='red')
+
+
+def mypyVersion() -> str:
+	return subprocess.run([sys.executable, '-m', 'mypy', '--version'], capture_output=True, text=True, check=True).stdout.strip()
+
+
+def skillDirectories() -> List[Path]:
+	"""
+	Every directory of PublishedSkills, whether it holds an install file or not
+	"""
+	return sorted(directory for directory in skillPath.iterdir() if directory.is_dir() and not directory.name.startswith('.') and directory.name not in EXCLUDED_DIRECTORIES)
+
+
+def skillSources(skill: Path) -> List[Path]:
+	return [source for source in sorted(skill.rglob('*.py')) if not EXCLUDED_DIRECTORIES.intersection(source.relative_to(skill).parts[:-1])]
+
+
+def sourcesHash(sources: List[Path], salt: str) -> str:
+	"""
+	Changes whenever a source file, the mypy config or the mypy version changes
+	"""
+	parts = [salt.encode(), configFile.read_bytes() if configFile.exists() else b'']
+	for source in sources:
+		parts.append(source.as_posix().encode())
+		parts.append(source.read_bytes())
+	return contentHash(b'\0'.join(parts))
+
+
+def checkSkill(skillName: str, sources: List[Path], sourceHash: str) -> CheckResult:
+	"""
+	Checks all the files of a skill in a single mypy run. Every skill gets its own incremental cache,
+	so concurrent runs never write to the same cache and stubs are only analyzed once per skill.
+	Module names follow the paths from the repository root, two files of a skill that share their
+	name are then two different modules instead of a duplicate module error
+	"""
+	process = subprocess.run(
+		[
+			sys.executable, '-m', 'mypy', '--pretty',
+			'--config-file', str(configFile),
+			'--incremental', '--cache-dir', str(mypyCache / skillName),
+			'--explicit-package-bases',
+			*[str(source) for source in sources]
+		],
+		capture_output=True,
+		text=True,
+		cwd=repoRoot
+	)
+	output = (process.stdout + process.stderr).strip()
+	return CheckResult(skillName, sourceHash, len(sources), process.returncode == 0, output)
+
+
+def loadResults() -> Dict[str, dict]:
+	try:
+		return json.loads(resultsFile.read_text(encoding='utf-8'))
+	except (OSError, ValueError):
+		return dict()
+
+
+def saveResults(results: List[CheckResult]):
+	resultsFile.parent.mkdir(parents=True, exist_ok=True)
+	resultsFile.write_text(json.dumps({result.skill: asdict(result) for result in results}, indent='\t', ensure_ascii=False), encoding='utf-8')
+
+
+@click.command()
+@click.argument('skills', nargs=-1)
+@click.option('-j', '--jobs', default=os.cpu_count() or 1, type=click.IntRange(min=1), show_default=True, envvar='TYPECHECK_JOBS', help='Number of skills checked in parallel')
+@click.option('--cache/--no-cache', default=True, show_default=True, help='Only check the skills whose files changed since the last run')
+def main(skills: Tuple[str, ...], jobs: int, cache: bool):
+	"""
+	Type checks every directory of PublishedSkills, or only SKILLS if given, and prints one report per skill.
+	Exits with 1 if any skill has issues
+	"""
+	skillDirs = [skill for skill in skillDirectories() if not skills or skill.name in skills]
+
+	previous = loadResults() if cache else dict()
+	salt = mypyVersion()
+
+	def check(skill: Path) -> Tuple[CheckResult, bool]:
+		skillName = skill.name
+		sources = skillSources(skill)
+		sourceHash = sourcesHash(sources, salt)
+		cached: Optional[dict] = previous.get(skillName)
+		if cached and cached['hash'] == sourceHash:
+			return CheckResult(**cached), True
+
+		if not sources:
+			return CheckResult(skillName, sourceHash, 0, True, ''), False
+
+		return checkSkill(skillName, sources, sourceHash), False
+
+	results = list()
+	checked = 0
+	with ThreadPoolExecutor(max_workers=jobs) as executor:
+		for result, fromCache in executor.map(check, skillDirs):
+			click.echo(result.report())
+			results.append(result)
+			checked += not fromCache
+
+	if cache:
+		saveResults([*[CheckResult(**entry) for skill, entry in previous.items() if skill not in {result.skill for result in results}], *results])
+
+	click.echo(f'{checked} skills checked, {len(results) - checked} unchanged', err=True)
+	if not all(result.success for result in results):
+		sys.exit(1)
+
+
+if __name__ == '__main__':
+	main()
@@ -0,0 +1,163 @@
+#  Copyright (c) 2026
+#
+#  This file, versionBenchmark.py, is part of Project Alice.
+#
+#  Project Alice is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>
+#
+#  Last modified: 2026.10.18 at 10:00:00 CEST
+
+from __future__ import annotations
+
+import random
+import re
+import sys
+import timeit
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List
+
+import click
+
+from store import TagVersion, buildVersionMapping
+
+sys.path.append(str(Path(__file__).resolve().parent.parent / 'Tools' / 'Common'))
+from Version import Version
+
+
+@dataclass(order=True)
+class LegacyVersion:
+	"""
+	Version as it was implemented before, kept as reference
+	"""
+	mainVersion: int = 0
+	updateVersion: int = 0
+	hotfix: int = 0
+	releaseType: str = 'release'
+	releaseNumber: int = 1
+
+
+	@classmethod
+	def fromString(cls, versionString: str) -> LegacyVersion:
+		versionMatch = re.search(
+			r'(?P<mainVersion>\d+)\.(?P<updateVersion>\d+)(?:\.(?P<hotfix>\d+))?(?:-(?P<releaseType>a|b|rc)(?P<releaseNumber>\d+)?)?',
+			str(versionString))
+
+		if not versionMatch:
+			return cls(0, 0, 0, '', 0)
+
+		return cls(
+			int(versionMatch.group('mainVersion')),
+			int(versionMatch.group('updateVersion')),
+			int(versionMatch.group('hotfix') or 0),
+			versionMatch.group('releaseType') or 'release',
+			int(versionMatch.group('releaseNumber') or 1))
+
+
+def legacyVersionMapping(tags: List[TagVersion]) -> Dict[str, str]:
+	"""
+	Version mapping as it was built before, kept as reference
+	"""
+	versions = dict()
+	while tags:
+		maxVersion = max(tags, key=lambda p: p.skillVersion)
+		tags = [tag for tag in tags if tag.aliceMinVersion < maxVersion.aliceMinVersion]
+		versions[str(maxVersion.aliceMinVersion)] = str(maxVersion.skillVersion)
+
+	return versions
+
+
+def randomVersionStrings(amount: int, distinct: int, seed: int) -> List[str]:
+	rand = random.Random(seed)
+	pool = [
+		f'{rand.randint(0, 3)}.{rand.randint(0, 20)}.{rand.randint(0, 20)}{rand.choice(["", "-a1", "-b2", "-rc3"])}'
+		for _ in range(distinct)
+	]
+	return [rand.choice(pool) for _ in range(amount)]
+
+
+def randomTags(rand: random.Random, amount: int) -> List[TagVersion]:
+	"""
+	Skill versions grow with the Alice version they need, with some noise so that
+	older skill versions requiring newer Alice versions exist as well
+	"""
+	tags = list()
+	for _ in range(amount):
+		alice = (rand.randint(0, 5), rand.randint(0, 30))
+		skill = (alice[0] + rand.randint(0, 2), (alice[1] + rand.randint(-10, 10)) % 40, rand.randint(0, 20))
+		releaseType = rand.choice(['', '', '', '-a1', '-b2', '-rc1'])
+		tags.append(TagVersion.fromString(f'{skill[0]}.{skill[1]}.{skill[2]}_{alice[0]}.{alice[1]}.0{releaseType}'))
+	return tags
+
+
+def report(name: str, legacy: float, current: float):
+	click.echo(f'{name:<8} legacy {legacy * 1000:9.2f}ms   current {current * 1000:9.2f}ms   x{legacy / current:.1f}')
+
+
+@click.group()
+def cli():
+	"""
+	Microbenchmarks of the store build internals against their previous implementation
+	"""
+	pass
+
+
+@cli.command()
+@click.option('-n', '--amount', default=20000, show_default=True, help='Amount of version strings')
+@click.option('-d', '--distinct', default=500, show_default=True, help='Amount of distinct version strings among them')
+@click.option('-r', '--repeat', default=5, show_default=True, help='Best of that many runs is reported')
+@click.option('-s', '--seed', default=0, show_default=True)
+def version(amount: int, distinct: int, repeat: int, seed: int):
+	"""
+	Parsing and sorting of version strings
+	"""
+	strings = randomVersionStrings(amount, distinct, seed)
+	legacyVersions = [LegacyVersion.fromString(string) for string in strings]
+	versions = Version.parseMany(strings)
+
+	if [str(v) for v in sorted(versions)] != [str(Version(*vars(v).values())) for v in sorted(legacyVersions)]:
+		raise click.ClickException('Versions do not sort the same way')
+
+	report('parse', min(timeit.repeat(lambda: [LegacyVersion.fromString(string) for string in strings], number=1, repeat=repeat)),
+		min(timeit.repeat(lambda: Version.parseMany(strings), number=1, repeat=repeat)))
+	report('sort', min(timeit.repeat(lambda: sorted(legacyVersions), number=1, repeat=repeat)),
+		min(timeit.repeat(lambda: sorted(versions), number=1, repeat=repeat)))
+	report('max', min(timeit.repeat(lambda: max(legacyVersions), number=1, repeat=repeat)),
+		min(timeit.repeat(lambda: max(versions), number=1, repeat=repeat)))
+
+
+@cli.command()
+@click.option('-n', '--amount', default=5000, show_default=True, help='Amount of tags of the benchmarked skill')
+@click.option('-c', '--checks', default=2000, show_default=True, help='Amount of random tag sets both algorithms have to agree on first')
+@click.option('-r', '--repeat', default=3, show_default=True, help='Best of that many runs is reported')
+@click.option('-s', '--seed', default=0, show_default=True)
+def mapping(amount: int, checks: int, repeat: int, seed: int):
+	"""
+	Building the version mapping out of a skill's tags
+	"""
+	rand = random.Random(seed)
+	for _ in range(checks):
+		tags = randomTags(rand, rand.randint(0, 40))
+		expected = legacyVersionMapping(tags)
+		actual = buildVersionMapping(tags)
+		if list(actual.items()) != list(expected.items()):
+			raise click.ClickException(f'Mappings differ for tags {[f"{tag.skillVersion}_{tag.aliceMinVersion}" for tag in tags]}')
+	click.echo(f'Both algorithms agree on {checks} random tag sets')
+
+	tags = randomTags(rand, amount)
+	report('mapping', min(timeit.repeat(lambda: legacyVersionMapping(tags), number=1, repeat=repeat)),
+		min(timeit.repeat(lambda: buildVersionMapping(tags), number=1, repeat=repeat)))
+
+
+if __name__ == '__main__':
+	cli()
@@ -0,0 +1,70 @@
+#  Copyright (c) 2026
+#
+#  This file, conftest.py, is part of Project Alice.
+#
+#  Project Alice is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>
+#
+#  Last modified: 2026.10.18 at 10:00:00 CEST
+
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+from typing import Callable
+
+import pytest
+
+
+repoRoot = Path(__file__).resolve().parent.parent
+
+# the scripts import their siblings by module name, as they do when run from their own directory
+for directory in ('Tools/Common', 'Tools/JsonDuplicatesChecker', 'Tools/SkillsUpdater', 'Tools/StringCleaner', 'PublishedSkills', 'ci_sources'):
+	sys.path.insert(0, str(repoRoot / directory))
+
+
+def git(cwd: Path, *args: str) -> str:
+	return subprocess.run(['git', *args], cwd=cwd, check=True, capture_output=True, text=True).stdout.strip()
+
+
+@pytest.fixture(autouse=True)
+def gitIdentity(monkeypatch):
+	for variable, value in (('GIT_AUTHOR_NAME', 'Test'), ('GIT_AUTHOR_EMAIL', 'test@test'), ('GIT_COMMITTER_NAME', 'Test'), ('GIT_COMMITTER_EMAIL', 'test@test')):
+		monkeypatch.setenv(variable, value)
+	monkeypatch.setenv('GIT_CONFIG_NOSYSTEM', '1')
+
+
+@pytest.fixture
+def skillRepo(tmp_path: Path) -> Callable[..., Path]:
+	"""
+	Creates a skill checked out of a local bare repository standing in for its remote,
+	with one commit on master holding its install file
+	"""
+	def create(name: str, version: str = '1.0.0', aliceMinVersion: str = '1.0.0') -> Path:
+		remote = tmp_path / 'remotes' / f'{name}.git'
+		skill = tmp_path / 'PublishedSkills' / name
+		remote.mkdir(parents=True)
+		git(remote, 'init', '--quiet', '--bare')
+		skill.mkdir(parents=True)
+		git(skill, 'init', '--quiet')
+		git(skill, 'symbolic-ref', 'HEAD', 'refs/heads/master')
+		(skill / f'{name}.install').write_text(json.dumps({'name': name, 'version': version, 'aliceMinVersion': aliceMinVersion}, indent='\t'), encoding='utf-8')
+		git(skill, 'add', '--all')
+		git(skill, 'commit', '--quiet', '--message', 'init')
+		git(skill, 'remote', 'add', 'origin', str(remote))
+		git(skill, 'push', '--quiet', 'origin', 'master')
+		return skill
+
+	return create
@@ -0,0 +1,138 @@
+#  Copyright (c) 2026
+#
+#  This file, test_bulkUpdate.py, is part of Project Alice.
+#
+#  Project Alice is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>
+#
+#  Last modified: 2026.10.18 at 10:00:00 CEST
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from click.testing import CliRunner
+
+import bulkUpdate
+from bulkUpdate import syncSkill
+from conftest import git
+
+
+def commit(repo: Path, fileName: str):
+	(repo / fileName).write_text(fileName, encoding='utf-8')
+	git(repo, 'add', '--all')
+	git(repo, 'commit', '--quiet', '--message', fileName)
+
+
+def pushFromAnotherClone(tmp_path: Path, name: str, fileName: str):
+	clone = tmp_path / 'clones' / name
+	git(tmp_path, 'clone', '--quiet', str(tmp_path / 'remotes' / f'{name}.git'), str(clone))
+	commit(clone, fileName)
+	git(clone, 'push', '--quiet', 'origin', 'master')
+
+
+def test_skillAtTheRemoteHeadIsUnchanged(skillRepo):
+	skill = skillRepo('Alpha')
+	result = syncSkill(skill, 'origin', 'master')
+	assert (result.status, result.before, result.after) == ('unchanged', git(skill, 'rev-parse', 'HEAD'), git(skill, 'rev-parse', 'HEAD'))
+
+
+def test_skillIsFastForwarded(skillRepo, tmp_path):
+	skill = skillRepo('Alpha')
+	pushFromAnotherClone(tmp_path, 'Alpha', 'new.txt')
+
+	result = syncSkill(skill, 'origin', 'master')
+
+	assert result.status == 'updated', result.reason
+	assert result.after == git(tmp_path / 'remotes' / 'Alpha.git', 'rev-parse', 'master') == git(skill, 'rev-parse', 'HEAD')
+	assert (skill / 'new.txt').exists()
+
+
+def test_detachedSkillIsFastForwardedAndStaysDetached(skillRepo, tmp_path):
+	skill = skillRepo('Alpha')
+	git(skill, 'checkout', '--quiet', '--detach')
+	pushFromAnotherClone(tmp_path, 'Alpha', 'new.txt')
+
+	result = syncSkill(skill, 'origin', 'master')
+
+	assert result.status == 'updated', result.reason
+	assert result.after == git(tmp_path / 'remotes' / 'Alpha.git', 'rev-parse', 'master') == git(skill, 'rev-parse', 'HEAD')
+	assert git(skill, 'rev-parse', '--abbrev-ref', 'HEAD') == 'HEAD'
+	assert git(skill, 'rev-parse', 'master') == result.before
+	assert (skill / 'new.txt').exists()
+
+
+def test_detachedSkillAheadOfTheRemoteIsReportedAsAhead(skillRepo):
+	skill = skillRepo('Alpha')
+	git(skill, 'checkout', '--quiet', '--detach')
+	commit(skill, 'local.txt')
+
+	result = syncSkill(skill, 'origin', 'master')
+
+	assert result.status == 'ahead'
+	assert git(skill, 'rev-parse', 'HEAD') == result.before
+
+
+def test_skillAheadOfTheRemoteIsReportedAsAhead(skillRepo):
+	skill = skillRepo('Alpha')
+	commit(skill, 'local.txt')
+
+	result = syncSkill(skill, 'origin', 'master')
+
+	assert result.status == 'ahead'
+	assert result.after == result.before == git(skill, 'rev-parse', 'HEAD')
+
+
+def test_divergedSkillIsLeftAlone(skillRepo, tmp_path):
+	skill = skillRepo('Alpha')
+	pushFromAnotherClone(tmp_path, 'Alpha', 'remote.txt')
+	commit(skill, 'local.txt')
+	head = git(skill, 'rev-parse', 'HEAD')
+
+	result = syncSkill(skill, 'origin', 'master')
+
+	assert (result.status, result.reason) == ('failed', 'Diverged from origin/master')
+	assert git(skill, 'rev-parse', 'HEAD') == head
+
+
+def test_skillOnAnotherBranchIsLeftAlone(skillRepo, tmp_path):
+	skill = skillRepo('Alpha')
+	pushFromAnotherClone(tmp_path, 'Alpha', 'remote.txt')
+	git(skill, 'checkout', '--quiet', '-b', 'feature')
+
+	result = syncSkill(skill, 'origin', 'master')
+
+	assert (result.status, result.reason) == ('failed', 'Checked out on branch feature, not master')
+
+
+def test_missingRemoteFails(skillRepo):
+	skill = skillRepo('Alpha')
+	result = syncSkill(skill, 'upstream', 'master')
+	assert result.status == 'failed'
+	assert result.reason.startswith('fatal:')
+
+
+def test_summaryAndExitCode(skillRepo, tmp_path, monkeypatch):
+	skillRepo('Alpha')
+	skillRepo('Beta')
+	commit(skillRepo('Gamma'), 'local.txt')
+	pushFromAnotherClone(tmp_path, 'Beta', 'remote.txt')
+	monkeypatch.setattr(bulkUpdate, 'skillRoot', tmp_path / 'PublishedSkills')
+
+	result = CliRunner().invoke(bulkUpdate.main)
+	assert result.exit_code == 0, result.output
+	assert result.output.splitlines()[-1] == '1 updated, 1 unchanged, 1 ahead, 0 failed'
+
+	result = CliRunner().invoke(bulkUpdate.main, ['--branch', 'develop', 'Alpha'])
+	assert result.exit_code == 1
+	assert 'No branch develop on origin' in result.output
@@ -0,0 +1,106 @@
+#  Copyright (c) 2026
+#
+#  This file, test_jsonPatch.py, is part of Project Alice.
+#
+#  Project Alice is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>
+#
+#  Last modified: 2026.10.18 at 10:00:00 CEST
+
+from __future__ import annotations
+
+import copy
+import json
+
+from JsonPatch import detectIndent, patch
+
+
+TABS = '{\n\t"name": "Alpha",\n\t"version": "1.0.0",\n\t"conditions": {\n\t\t"lang": [\n\t\t\t"en",\n\t\t\t"de"\n\t\t],\n\t\t"online": true\n\t}\n}\n'
+SPACES = TABS.replace('\t', '  ')
+
+
+def patched(content: str, edit) -> str:
+	data = json.loads(content)
+	edit(data)
+	result = patch(content, data)
+	assert json.loads(result) == data
+	return result
+
+
+def test_unchangedFileIsKeptByteForByte():
+	for content in (TABS, SPACES, '{"compact":{"a":[1,2]},  "odd" :\t"spacing"}', '{\r\n\t"crlf": 1\r\n}'):
+		assert patch(content, json.loads(content)) == content
+
+
+def test_changedValueKeepsTheTabs():
+	result = patched(TABS, lambda data: data.update(version='1.0.1'))
+	assert result == TABS.replace('1.0.0', '1.0.1')
+
+
+def test_indentationIsDetected():
+	assert detectIndent(TABS) == '\t'
+	assert detectIndent(SPACES) == '  '
+	assert detectIndent('{"name": "Alpha"}') == '\t'
+
+
+def test_addedMemberUsesTheFileIndentation():
+	assert patched(SPACES, lambda data: data.update(author='someone')) == SPACES[:-3] + ',\n  "author": "someone"\n}\n'
+	assert patched(TABS, lambda data: data.update(author='someone')) == TABS[:-3] + ',\n\t"author": "someone"\n}\n'
+
+
+def test_nestedInsert():
+	result = patched(TABS, lambda data: data['conditions'].update(skill=['Beta']))
+	assert result == TABS.replace('\t\t"online": true\n', '\t\t"online": true,\n\t\t"skill": [\n\t\t\t"Beta"\n\t\t]\n')
+
+
+def test_nestedDelete():
+	def edit(data):
+		del data['conditions']['lang']
+
+	assert patched(TABS, edit) == TABS.replace('\t\t"lang": [\n\t\t\t"en",\n\t\t\t"de"\n\t\t],\n', '')
+
+
+def test_deletingTheLastMembers():
+	def edit(data):
+		del data['conditions']['online']
+		del data['conditions']['lang']
+
+	assert patched(TABS, edit) == TABS.replace('{\n\t\t"lang": [\n\t\t\t"en",\n\t\t\t"de"\n\t\t],\n\t\t"online": true\n\t}', '{}')
+
+
+def test_insertIntoAnEmptyObject():
+	content = '{\n\t"conditions": {}\n}\n'
+	assert patched(content, lambda data: data['conditions'].update(online=True)) == '{\n\t"conditions": {\n\t\t"online": true\n\t}\n}\n'
+
+
+def test_unicodeIsWrittenAsIs():
+	content = '{\n\t"name": "Caf\\u00e9",\n\t"desc": "Grüße"\n}\n'
+	assert patch(content, json.loads(content)) == content
+
+	result = patched(content, lambda data: data.update(desc='Ελληνικά 🎉'))
+	assert result == '{\n\t"name": "Caf\\u00e9",\n\t"desc": "Ελληνικά 🎉"\n}\n'
+
+
+def test_everyEditRoundTrips():
+	original = json.loads(TABS)
+	edits = [
+		lambda data: data.pop('name'),
+		lambda data: data.pop('conditions'),
+		lambda data: data['conditions']['lang'].append('fr'),
+		lambda data: data.update(conditions='none'),
+		lambda data: data.update(extra={'nested': {'deep': [1, {'x': None}]}})
+	]
+	for edit in edits:
+		data = copy.deepcopy(original)
+		edit(data)
+		assert json.loads(patch(TABS, data)) == data
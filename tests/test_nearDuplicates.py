@@ -0,0 +1,56 @@
+#  Copyright (c) 2026
+#
+#  This file, test_nearDuplicates.py, is part of Project Alice.
+#
+#  Project Alice is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>
+#
+#  Last modified: 2026.10.18 at 10:00:00 CEST
+
+from __future__ import annotations
+
+from NearDuplicates import NearDuplicateFinder, Utterance, identicalGroups, shingles
+
+
+def utterances(*texts: str):
+	return [Utterance(f'en.json > intent{index}', text, shingles(text)) for index, text in enumerate(texts)]
+
+
+def test_utterancesOnlyDifferingBySlotValuesAreOneGroup():
+	found = utterances(
+		'turn on the {kitchen:=>room} light',
+		'turn on the {bedroom:=>room} light',
+		'what time is it',
+		'Turn on the {hall:=>room} light'
+	)
+
+	assert identicalGroups(found) == [[found[0], found[1], found[3]]]
+	assert NearDuplicateFinder().find(found) == list()
+
+
+def test_groupsAreComparedThroughTheirFirstUtterance():
+	found = utterances(
+		'please turn on the {kitchen:=>room} light now',
+		'please turn on the {hall:=>room} light now',
+		'please turn on the {kitchen:=>room} light right now'
+	)
+
+	pairs = NearDuplicateFinder(threshold=0.5).find(found)
+
+	assert [(first, second) for _, first, second in pairs] == [(found[0], found[2])]
+
+
+def test_emptyUtterancesAreIgnored():
+	found = utterances('', '?', 'hello there')
+	assert identicalGroups(found) == list()
+	assert NearDuplicateFinder().find(found) == list()
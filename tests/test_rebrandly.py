@@ -0,0 +1,117 @@
+#  Copyright (c) 2026
+#
+#  This file, test_rebrandly.py, is part of Project Alice.
+#
+#  Project Alice is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>
+#
+#  Last modified: 2026.10.18 at 10:00:00 CEST
+
+from __future__ import annotations
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from typing import List
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from Rebrandly import RebrandlyClient
+
+
+LINKS = [{'id': f'id{i}', 'slashtag': f'Skill{i}', 'clicks': i} for i in range(7)]
+
+
+class StubApi(BaseHTTPRequestHandler):
+	"""
+	Serves LINKS two per page, after failing the first `failures` requests
+	"""
+	requests: List[dict] = list()
+	failures = 0
+
+
+	def do_GET(self):
+		query = {key: values[0] for key, values in parse_qs(urlparse(self.path).query).items()}
+		StubApi.requests.append({'path': urlparse(self.path).path, 'apikey': self.headers.get('apikey'), **query})
+		if StubApi.failures:
+			StubApi.failures -= 1
+			self.send_response(503)
+			self.end_headers()
+			return
+
+		start = [link['id'] for link in LINKS].index(query['last']) + 1 if 'last' in query else 0
+		body = json.dumps(LINKS[start:start + 2]).encode()
+		self.send_response(200)
+		self.send_header('Content-Type', 'application/json')
+		self.send_header('Content-Length', str(len(body)))
+		self.end_headers()
+		self.wfile.write(body)
+
+
+	def log_message(self, *args):
+		pass
+
+
+@pytest.fixture
+def api(monkeypatch):
+	StubApi.requests = list()
+	StubApi.failures = 0
+	server = HTTPServer(('127.0.0.1', 0), StubApi)
+	thread = threading.Thread(target=server.serve_forever, kwargs={'poll_interval': 0.05}, daemon=True)
+	thread.start()
+	monkeypatch.setenv('RebrandlyApiUrl', f'http://127.0.0.1:{server.server_address[1]}/v1/')
+	monkeypatch.setenv('RebrandlyApiKey', 'secret')
+	yield StubApi
+	server.shutdown()
+	server.server_close()
+
+
+def test_linksArePagedWithTheLastIdAsCursor(api):
+	with RebrandlyClient(cacheFile=None) as client:
+		assert client.clickCounts() == {f'Skill{i}': i for i in range(7)}
+
+	assert [request.get('last') for request in api.requests] == [None, 'id1', 'id3', 'id5', 'id6']
+	assert {(request['path'], request['apikey']) for request in api.requests} == {('/v1/links', 'secret')}
+
+
+def test_failedRequestsAreRetried(api):
+	api.failures = 2
+	with RebrandlyClient(cacheFile=None, backoff=0) as client:
+		assert len(list(client.links())) == 7
+
+	assert len(api.requests) == 7
+
+
+def test_findSlashtagsStopsOnceAllAreFound(api):
+	with RebrandlyClient(cacheFile=None) as client:
+		assert client.findSlashtags({'skill0', 'SKILL3', 'unknown'}) == {'skill0', 'skill3'}
+		assert len(api.requests) == 5
+
+		api.requests.clear()
+		assert client.findSlashtags({'Skill0', 'skill2'}) == {'skill0', 'skill2'}
+		assert len(api.requests) == 2
+		assert (api.requests[0]['orderBy'], api.requests[0]['orderDir'], api.requests[0]['limit']) == ('createdAt', 'desc', '25')
+
+
+def test_listingIsCachedWithinTheTtl(api, tmp_path):
+	cacheFile = tmp_path / 'rebrandly.json'
+	with RebrandlyClient(cacheFile=cacheFile, cacheTtl=60) as client:
+		assert len(client.snapshot()) == 7
+
+	with RebrandlyClient(cacheFile=cacheFile, cacheTtl=60) as client:
+		assert client.slashtags() == {f'skill{i}' for i in range(7)}
+		assert client.findSlashtags({'Skill4', 'other'}) == {'skill4'}
+
+	assert len(api.requests) == 5
+	assert json.loads(cacheFile.read_text(encoding='utf-8')) == LINKS
@@ -0,0 +1,142 @@
+#  Copyright (c) 2026
+#
+#  This file, test_release.py, is part of Project Alice.
+#
+#  Project Alice is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>
+#
+#  Last modified: 2026.10.18 at 10:00:00 CEST
+
+from __future__ import annotations
+
+import json
+
+from Release import ReleaseState, changedSkills, release, releaseSkill
+from conftest import git
+
+
+def bumpVersion(skill, version: str):
+	installFile = skill / f'{skill.name}.install'
+	data = json.loads(installFile.read_text(encoding='utf-8'))
+	data['version'] = version
+	installFile.write_text(json.dumps(data, indent='\t'), encoding='utf-8')
+
+
+def test_releaseCommitsTagsAndPushes(skillRepo, tmp_path):
+	skill = skillRepo('Alpha')
+	bumpVersion(skill, '1.0.1')
+
+	result = releaseSkill(skill, 'origin', 'Release {tag}')
+
+	assert (result.status, result.tag, result.error) == ('pushed', '1.0.1_1.0.0', '')
+	remote = tmp_path / 'remotes' / 'Alpha.git'
+	assert git(remote, 'tag') == '1.0.1_1.0.0'
+	assert git(remote, 'log', '-1', '--format=%s', 'master') == 'Release 1.0.1_1.0.0'
+	assert git(remote, 'rev-parse', 'master') == git(skill, 'rev-parse', 'HEAD')
+
+
+def test_untrackedFilesAreNotReleased(skillRepo, tmp_path):
+	skill = skillRepo('Alpha')
+	(skill / 'notes.txt~').write_text('backup')
+	assert changedSkills(tmp_path / 'PublishedSkills') == []
+
+	bumpVersion(skill, '1.0.1')
+	assert changedSkills(tmp_path / 'PublishedSkills') == [skill]
+	assert releaseSkill(skill, 'origin', 'Release {tag}').released
+
+	assert git(skill, 'ls-files') == 'Alpha.install'
+	assert git(skill, 'status', '--porcelain') == '?? notes.txt~'
+
+
+def test_failedReleaseIsResumed(skillRepo, tmp_path):
+	alpha = skillRepo('Alpha')
+	beta = skillRepo('Beta')
+	bumpVersion(alpha, '1.0.1')
+	bumpVersion(beta, '2.0.0')
+	git(beta, 'remote', 'set-url', 'origin', str(tmp_path / 'nowhere.git'))
+
+	state = ReleaseState(tmp_path / 'release.json')
+	results = release([alpha, beta], 'origin', 'Release {tag}', jobs=2)
+	assert [result.status for result in results] == ['pushed', 'failed']
+	assert results[1].error.startswith('fatal:')
+	state.update(results)
+	state.save()
+	assert ReleaseState(tmp_path / 'release.json').pending == ['Beta']
+
+	# nothing is left to commit, the tag exists already, only the push is retried
+	git(beta, 'remote', 'set-url', 'origin', str(tmp_path / 'remotes' / 'Beta.git'))
+	results = release([beta], 'origin', 'Release {tag}')
+	assert results[0].released
+	assert git(tmp_path / 'remotes' / 'Beta.git', 'tag') == '2.0.0_1.0.0'
+
+	state = ReleaseState(tmp_path / 'release.json')
+	state.update(results)
+	state.save()
+	assert not (tmp_path / 'release.json').exists()
+	state.save()
+
+
+def test_tagOnAnotherCommitFails(skillRepo):
+	skill = skillRepo('Alpha')
+	git(skill, 'tag', '1.0.1_1.0.0')
+	bumpVersion(skill, '1.0.1')
+
+	result = releaseSkill(skill, 'origin', 'Release {tag}')
+
+	assert result.status == 'failed'
+	assert 'already exists' in result.error
+
+
+def test_detachedHeadIsReleasedToTheBranch(skillRepo, tmp_path):
+	skill = skillRepo('Alpha')
+	git(skill, 'checkout', '--quiet', '--detach')
+	bumpVersion(skill, '1.0.1')
+
+	result = releaseSkill(skill, 'origin', 'Release {tag}')
+
+	assert (result.status, result.error) == ('pushed', '')
+	remote = tmp_path / 'remotes' / 'Alpha.git'
+	assert git(remote, 'rev-parse', 'master') == git(skill, 'rev-parse', 'HEAD')
+	assert git(remote, 'tag') == '1.0.1_1.0.0'
+	assert git(skill, 'rev-parse', '--abbrev-ref', 'HEAD') == 'HEAD'
+
+
+def test_detachedHeadIsReleasedToTheGivenBranch(skillRepo, tmp_path):
+	skill = skillRepo('Alpha')
+	git(skill, 'checkout', '--quiet', '--detach')
+	bumpVersion(skill, '1.0.1')
+
+	assert release([skill], 'origin', 'Release {tag}', branch='develop')[0].released
+
+	remote = tmp_path / 'remotes' / 'Alpha.git'
+	assert git(remote, 'rev-parse', 'develop') == git(skill, 'rev-parse', 'HEAD')
+	assert git(remote, 'rev-parse', 'master') != git(skill, 'rev-parse', 'HEAD')
+
+
+def test_detachedHeadBehindTheBranchIsNotForced(skillRepo, tmp_path):
+	skill = skillRepo('Alpha')
+	clone = tmp_path / 'clone'
+	git(tmp_path, 'clone', '--quiet', str(tmp_path / 'remotes' / 'Alpha.git'), str(clone))
+	(clone / 'other.txt').write_text('other', encoding='utf-8')
+	git(clone, 'add', '--all')
+	git(clone, 'commit', '--quiet', '--message', 'other')
+	git(clone, 'push', '--quiet', 'origin', 'master')
+	remoteHead = git(clone, 'rev-parse', 'HEAD')
+
+	git(skill, 'checkout', '--quiet', '--detach')
+	bumpVersion(skill, '1.0.1')
+	result = releaseSkill(skill, 'origin', 'Release {tag}')
+
+	assert result.status == 'failed'
+	assert result.error.startswith('error: failed to push')
+	assert git(tmp_path / 'remotes' / 'Alpha.git', 'rev-parse', 'master') == remoteHead
@@ -0,0 +1,67 @@
+#  Copyright (c) 2026
+#
+#  This file, test_store.py, is part of Project Alice.
+#
+#  Project Alice is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>
+#
+#  Last modified: 2026.10.18 at 10:00:00 CEST
+
+from __future__ import annotations
+
+from BuildCache import BuildCache
+from conftest import git
+from store import buildSkill
+
+
+def test_cachedSkillPicksUpNewRemoteTags(skillRepo, tmp_path):
+	skill = skillRepo('Alpha', '1.2.0', '1.0.0')
+	git(skill, 'tag', '1.2.0_1.0.0')
+	git(skill, 'push', '--quiet', 'origin', '--tags')
+	installer = skill / 'Alpha.install'
+
+	cache = BuildCache(tmp_path / 'build.json')
+	entry, cached = buildSkill(installer, cache)
+	assert (entry['versionMapping'], cached) == ({'1.0.0': '1.2.0'}, False)
+	cache.putSkill('Alpha', entry)
+	cache.save()
+
+	cache = BuildCache(tmp_path / 'build.json')
+	entry, cached = buildSkill(installer, cache)
+	assert cached
+	cache.putSkill('Alpha', entry)
+	cache.save()
+
+	# a new release tagged on the remote only, the skill's checkout is untouched
+	other = tmp_path / 'other'
+	git(tmp_path, 'clone', '--quiet', str(tmp_path / 'remotes' / 'Alpha.git'), str(other))
+	git(other, 'tag', '1.3.0_1.1.0')
+	git(other, 'push', '--quiet', 'origin', '1.3.0_1.1.0')
+
+	entry, cached = buildSkill(installer, BuildCache(tmp_path / 'build.json'))
+	assert (entry['versionMapping'], cached) == ({'1.1.0': '1.3.0', '1.0.0': '1.2.0'}, False)
+
+
+def test_localTagModeNeverQueriesTheRemote(skillRepo, tmp_path):
+	skill = skillRepo('Alpha', '1.2.0', '1.0.0')
+	git(skill, 'tag', '1.2.0_1.0.0')
+	git(skill, 'remote', 'set-url', 'origin', str(tmp_path / 'nowhere.git'))
+	installer = skill / 'Alpha.install'
+
+	cache = BuildCache(tmp_path / 'build.json')
+	entry, _ = buildSkill(installer, cache, tagMode='local')
+	cache.putSkill('Alpha', entry)
+	cache.save()
+
+	entry, cached = buildSkill(installer, BuildCache(tmp_path / 'build.json'), tagMode='local')
+	assert (entry['versionMapping'], cached) == ({'1.0.0': '1.2.0'}, True)
@@ -0,0 +1,75 @@
+#  Copyright (c) 2026
+#
+#  This file, test_storeDelta.py, is part of Project Alice.
+#
+#  Project Alice is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>
+#
+#  Last modified: 2026.10.18 at 10:00:00 CEST
+
+from __future__ import annotations
+
+import json
+
+from StoreDelta import DeltaFeed
+
+
+def publish(feed: DeltaFeed, file):
+	file.write_text(json.dumps(feed.feed()), encoding='utf-8')
+
+
+def test_changesAreRecordedAsDeltas(tmp_path):
+	feed = DeltaFeed(tmp_path / 'store.json', history=5)
+	assert feed.update({'Alpha': {'version': '1.0.0'}})
+	feed.save()
+
+	feed = DeltaFeed(tmp_path / 'store.json', history=5)
+	assert not feed.update({'Alpha': {'version': '1.0.0'}})
+	assert feed.update({'Alpha': {'version': '1.0.1'}})
+
+	assert feed.feed() == {
+		'revision'    : 2,
+		'baseRevision': 1,
+		'deltas'      : [{'changed': {'Alpha': {'set': {'version': '1.0.1'}}}, 'removed': [], 'revision': 2}]
+	}
+
+
+def test_lostStoreGoesOnFromThePublishedRevision(tmp_path):
+	feed = DeltaFeed(tmp_path / 'store.json', history=5)
+	for version in ('1.0.0', '1.0.1', '1.0.2'):
+		feed.update({'Alpha': {'version': version}})
+	publish(feed, tmp_path / 'skills.delta')
+
+	feed = DeltaFeed(tmp_path / 'evicted.json', history=5, published=tmp_path / 'skills.delta')
+	assert feed.update({'Alpha': {'version': '1.0.2'}})
+
+	assert feed.feed() == {'revision': 4, 'baseRevision': 4, 'deltas': []}
+
+
+def test_staleStoreIsDropped(tmp_path):
+	feed = DeltaFeed(tmp_path / 'store.json', history=5)
+	feed.update({'Alpha': {'version': '1.0.0'}})
+	feed.save()
+	feed.update({'Alpha': {'version': '1.0.1'}})
+	publish(feed, tmp_path / 'skills.delta')
+
+	feed = DeltaFeed(tmp_path / 'store.json', history=5, published=tmp_path / 'skills.delta')
+	assert feed.update({'Alpha': {'version': '1.0.1'}})
+
+	assert feed.feed() == {'revision': 3, 'baseRevision': 3, 'deltas': []}
+
+
+def test_missingPublishedFeedIsIgnored(tmp_path):
+	feed = DeltaFeed(tmp_path / 'store.json', history=5, published=tmp_path / 'skills.delta')
+	assert feed.update({'Alpha': {'version': '1.0.0'}})
+	assert feed.revision == 1
@@ -0,0 +1,71 @@
+#  Copyright (c) 2026
+#
+#  This file, test_stringCleaner.py, is part of Project Alice.
+#
+#  Project Alice is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>
+#
+#  Last modified: 2026.10.18 at 10:00:00 CEST
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from StringCleaner import StringCleaner, main
+
+
+def writeSkill(root: Path, name: str, declared: list, talks: dict):
+	skill = root / 'PublishedSkills' / name
+	(skill / 'talks').mkdir(parents=True)
+	(skill / f'{name}.install').write_text(json.dumps({'name': name, 'conditions': {'lang': declared}}), encoding='utf-8')
+	for language, keys in talks.items():
+		(skill / 'talks' / f'{language}.json').write_text(json.dumps({key: list() for key in keys}), encoding='utf-8')
+
+
+@pytest.fixture
+def skills(tmp_path: Path, monkeypatch):
+	writeSkill(tmp_path, 'Alpha', ['en', 'de', 'fr'], {'en': ['hi', 'bye'], 'de': ['hi']})
+	writeSkill(tmp_path, 'Beta', ['en'], {'en': ['hello'], 'it': ['hello']})
+	workingDirectory = tmp_path / 'Tools' / 'StringCleaner'
+	workingDirectory.mkdir(parents=True)
+	monkeypatch.chdir(workingDirectory)
+
+
+def test_coverageOnlyListsTheLanguagesOfEachSkill(skills):
+	result = CliRunner().invoke(main, ['--no-cache', '--coverage', '-'])
+
+	assert result.exit_code == 0, result.output
+	report = json.loads(result.output)
+	assert report['languages'] == ['de', 'en', 'fr', 'it']
+	assert {skill: sorted(languages) for skill, languages in report['skills'].items()} == {'Alpha': ['de', 'en', 'fr'], 'Beta': ['en', 'it']}
+	assert report['skills']['Alpha']['fr'] == {'exists': False, 'missing': ['bye', 'hi'], 'extra': list()}
+	assert report['skills']['Alpha']['de']['missing'] == ['bye']
+
+
+def test_failOnMissing(skills):
+	assert CliRunner().invoke(main, ['--no-cache', '--coverage', '-', '--fail-on-missing']).exit_code == 1
+
+	result = CliRunner().invoke(main, ['--no-cache', '--fail-on-missing'])
+	assert result.exit_code == 2
+	assert '--fail-on-missing only works along with --coverage' in result.output
+
+
+def test_stringLiteralsOfInvalidSources():
+	assert StringCleaner.extractStringLiterals(b'say("hello")\nname = f"{x}"\n') == {'hello'}
+	assert StringCleaner.extractStringLiterals(b'say("hello"\nsay(\'unclosed\')') == {'hello', 'unclosed'}
+	assert StringCleaner.extractStringLiterals(b'say("hello")\n# \xff\xfe latin-1 comment\nsay(\'bye\')\n') == {'hello', 'bye'}
+	assert StringCleaner.extractStringLiterals(b'# -*- coding: unknown -*-\nsay("hello")\n') == {'hello'}
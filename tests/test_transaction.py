@@ -0,0 +1,141 @@
+#  Copyright (c) 2026
+#
+#  This file, test_transaction.py, is part of Project Alice.
+#
+#  Project Alice is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>
+#
+#  Last modified: 2026.10.18 at 10:00:00 CEST
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+import click
+import pytest
+from click.testing import CliRunner
+
+import SkillUpdater
+from Transaction import InstallFile, Journal, Transaction, TransactionError
+
+
+@pytest.fixture
+def skills(tmp_path: Path, monkeypatch):
+	skillRoot = tmp_path / 'PublishedSkills'
+	paths = list()
+	for name in ('Alpha', 'Beta', 'Gamma'):
+		path = skillRoot / name / f'{name}.install'
+		path.parent.mkdir(parents=True)
+		path.write_text(json.dumps({'name': name, 'version': '1.0.0'}, indent='\t'), encoding='utf-8')
+		paths.append(path)
+
+	monkeypatch.setattr(SkillUpdater, 'skillRoot', skillRoot)
+	monkeypatch.setattr(SkillUpdater, 'journalDir', tmp_path / 'journal')
+	return paths
+
+
+def bump(installFile: InstallFile):
+	installFile.data['version'] = '1.0.1'
+	installFile.rewrite(f'Rewritten "{installFile.path.stem}"')
+
+
+def journal() -> Journal:
+	return Journal(SkillUpdater.journalDir, SkillUpdater.skillRoot)
+
+
+def versions(paths) -> list:
+	return [json.loads(path.read_text(encoding='utf-8'))['version'] for path in paths]
+
+
+def failingReplace(failAt: int):
+	calls = list()
+	replace = os.replace
+
+	def fake(source, destination):
+		calls.append(destination)
+		if len(calls) == failAt:
+			raise OSError('disk full')
+		replace(source, destination)
+
+	return fake
+
+
+def test_failedReplaceMarksTheRunPartial(skills, monkeypatch):
+	monkeypatch.setattr(os, 'replace', failingReplace(2))
+
+	with pytest.raises(TransactionError) as error:
+		Transaction(journal(), 'update').run(skills, bump)
+
+	assert [installFile.path for installFile in error.value.replaced] == skills[:1]
+	assert journal().run(error.value.runId)['status'] == 'partial'
+	assert versions(skills) == ['1.0.1', '1.0.0', '1.0.0']
+	assert not list(SkillUpdater.skillRoot.glob('*/.*.tmp'))
+
+
+def test_failedReplaceReportsTheReplacedFiles(skills, monkeypatch, capsys):
+	monkeypatch.setattr(os, 'replace', failingReplace(2))
+
+	with pytest.raises(click.ClickException) as error:
+		SkillUpdater.runTransaction('update', bump, paths=skills)
+
+	assert capsys.readouterr().out == 'Rewritten "Alpha"\n'
+	assert 'Replacing' in error.value.message and 'Beta.install" failed' in error.value.message
+	assert 'Aborted' not in error.value.message
+
+
+def test_partialRunIsReverted(skills, monkeypatch):
+	with monkeypatch.context() as patched:
+		patched.setattr(os, 'replace', failingReplace(2))
+		with pytest.raises(TransactionError):
+			Transaction(journal(), 'update').run(skills, bump)
+
+	result = CliRunner().invoke(SkillUpdater.cli, ['revert'])
+
+	assert result.exit_code == 0, result.output
+	assert result.output.startswith('Reverted Alpha\nJournaled as run ')
+	assert versions(skills) == ['1.0.0', '1.0.0', '1.0.0']
+
+
+def test_revertRefusesFilesChangedSince(skills):
+	transaction = Transaction(journal(), 'update')
+	transaction.run(skills, bump)
+	skills[1].write_text(skills[1].read_text(encoding='utf-8').replace('1.0.1', '2.0.0'), encoding='utf-8')
+
+	result = CliRunner().invoke(SkillUpdater.cli, ['revert', transaction.runId])
+
+	assert result.exit_code == 1
+	assert 'Beta.install" was changed since run' in result.output
+	assert 'Aborted, no install file was changed' in result.output
+	assert versions(skills) == ['1.0.1', '2.0.0', '1.0.1']
+	assert journal().run(transaction.runId)['status'] == 'done'
+
+
+def test_lineEndingsAreKept(skills):
+	content = '{\r\n\t"name": "Alpha",\r\n\t"version": "1.0.0"\r\n}\r\n'
+	skills[0].write_bytes(content.encode())
+	skills[1].write_bytes(skills[1].read_bytes().replace(b'\r\n', b'\n'))
+	lineFeeds = skills[1].read_bytes()
+
+	transaction = Transaction(journal(), 'update')
+	transaction.run(skills[:2], bump)
+
+	assert skills[0].read_bytes() == content.replace('1.0.0', '1.0.1').encode()
+	assert skills[1].read_bytes() == lineFeeds.replace(b'1.0.0', b'1.0.1')
+
+	result = CliRunner().invoke(SkillUpdater.cli, ['revert', transaction.runId])
+
+	assert result.exit_code == 0, result.output
+	assert skills[0].read_bytes() == content.encode()
+	assert skills[1].read_bytes() == lineFeeds
@@ -0,0 +1,76 @@
+#  Copyright (c) 2026
+#
+#  This file, test_typecheck.py, is part of Project Alice.
+#
+#  Project Alice is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>
+#
+#  Last modified: 2026.10.18 at 10:00:00 CEST
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+import typecheck
+
+
+@pytest.fixture
+def skills(tmp_path: Path, monkeypatch) -> Path:
+	skillPath = tmp_path / 'PublishedSkills'
+	files = {
+		'Alpha/Alpha.install'                   : '{}',
+		'Alpha/Alpha.py'                        : 'x: int = 1\n',
+		'Alpha/.venv/lib/site.py'               : 'x: int = 1\n',
+		'AuthorSkills/Beta/Beta.install'        : '{}',
+		'AuthorSkills/Beta/Beta.py'             : 'x: int = 1\n',
+		'AuthorSkills/Gamma/Gamma.py'           : 'x: int = 1\n',
+		'WithoutInstall/tool.py'                : 'x: int = 1\n',
+		'.hidden/hidden.py'                     : 'x: int = 1\n',
+		'__pycache__/bulkUpdate.cpython-37.pyc' : ''
+	}
+	for name, content in files.items():
+		(skillPath / name).parent.mkdir(parents=True, exist_ok=True)
+		(skillPath / name).write_text(content, encoding='utf-8')
+	(skillPath / 'bulkUpdate.py').write_text('x: int = 1\n', encoding='utf-8')
+
+	monkeypatch.setattr(typecheck, 'skillPath', skillPath)
+	return skillPath
+
+
+def test_everyDirectoryIsChecked(skills):
+	directories = typecheck.skillDirectories()
+
+	assert [directory.name for directory in directories] == ['Alpha', 'AuthorSkills', 'WithoutInstall']
+	assert [source.relative_to(skills).as_posix() for directory in directories for source in typecheck.skillSources(directory)] == [
+		'Alpha/Alpha.py',
+		'AuthorSkills/Beta/Beta.py',
+		'AuthorSkills/Gamma/Gamma.py',
+		'WithoutInstall/tool.py'
+	]
+
+
+def test_filesSharingTheirNameAreNotDuplicateModules(skills, tmp_path, monkeypatch):
+	for name in ('AuthorSkills/Beta/utils.py', 'AuthorSkills/Gamma/utils.py'):
+		(skills / name).write_text('def double(x: int) -> int:\n\treturn x * 2\n', encoding='utf-8')
+	(skills / 'AuthorSkills/Gamma/Gamma.py').write_text('y: str = 1\n', encoding='utf-8')
+	monkeypatch.setattr(typecheck, 'mypyCache', tmp_path / '.mypy_cache')
+	monkeypatch.setattr(typecheck, 'repoRoot', tmp_path)
+
+	sources = typecheck.skillSources(skills / 'AuthorSkills')
+	result = typecheck.checkSkill('AuthorSkills', sources, '')
+
+	assert not result.success
+	assert 'Duplicate module' not in result.output
+	assert 'Gamma/Gamma.py:1: error: Incompatible types' in result.output
@@ -0,0 +1,51 @@
+#  Copyright (c) 2026
+#
+#  This file, test_versionMapping.py, is part of Project Alice.
+#
+#  Project Alice is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>
+#
+#  Last modified: 2026.10.18 at 10:00:00 CEST
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from Version import Version
+from versionBenchmark import LegacyVersion, legacyVersionMapping, randomTags, randomVersionStrings
+from store import TagVersion, buildVersionMapping
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_mappingMatchesTheLegacyAlgorithm(seed: int):
+	rand = random.Random(seed)
+	for _ in range(500):
+		tags = randomTags(rand, rand.randint(0, 40))
+		assert list(buildVersionMapping(tags).items()) == list(legacyVersionMapping(tags).items()), [f'{tag.skillVersion}_{tag.aliceMinVersion}' for tag in tags]
+
+
+def test_mappingOfEdgeCases():
+	assert buildVersionMapping([]) == dict()
+
+	tags = [TagVersion.fromString(tag) for tag in ('1.0.0_1.0.0', '1.0.0_1.0.0', '1.1.0-rc1_1.0.0', '0.9.0_1.1.0', '2.0.0_0.9.0')]
+	assert list(buildVersionMapping(tags).items()) == list(legacyVersionMapping(tags).items())
+
+
+@pytest.mark.parametrize('seed', range(3))
+def test_versionsSortLikeTheLegacyImplementation(seed: int):
+	strings = randomVersionStrings(2000, 200, seed)
+	versions = sorted(Version.parseMany(strings))
+	legacyVersions = sorted(LegacyVersion.fromString(string) for string in strings)
+	assert [str(version) for version in versions] == [str(Version(*vars(legacy).values())) for legacy in legacyVersions]